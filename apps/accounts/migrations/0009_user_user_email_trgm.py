@@ -0,0 +1,22 @@
+# Generated by Django 5.2.6 on 2026-10-16 14:40
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0008_alter_user_deleted_at"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="user",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["email"], name="user_email_trgm", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+    ]
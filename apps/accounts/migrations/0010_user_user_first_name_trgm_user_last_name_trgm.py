@@ -0,0 +1,30 @@
+# Generated by Django 5.2.6 on 2026-10-16 15:05
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0009_user_user_email_trgm"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="user",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["first_name"],
+                name="user_first_name_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="user",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["last_name"],
+                name="user_last_name_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
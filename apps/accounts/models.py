@@ -1,5 +1,7 @@
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils.translation import gettext_lazy as _
 from django.utils import timezone
 from apps.common.models import BaseModel
@@ -44,6 +46,21 @@ class User(AbstractBaseUser, BaseModel, PermissionsMixin):
     class Meta:
         verbose_name = _("User")
         verbose_name_plural = _("Users")
+        indexes = [
+            # Admin search compiles to UPPER("col"::text) LIKE UPPER(...), so the
+            # trigram indexes cover that expression rather than the bare column
+            GinIndex(
+                OpClass(Upper("email"), name="gin_trgm_ops"), name="user_email_trgm"
+            ),
+            GinIndex(
+                OpClass(Upper("first_name"), name="gin_trgm_ops"),
+                name="user_first_name_trgm",
+            ),
+            GinIndex(
+                OpClass(Upper("last_name"), name="gin_trgm_ops"),
+                name="user_last_name_trgm",
+            ),
+        ]
 
     def __str__(self):
         return self.full_name
@@ -66,7 +66,7 @@ class MaintenanceTasks:
     """System maintenance tasks"""
 
     @staticmethod
-    @shared_task(name="accounts.cleanup_expired_otps", queue="maintenance")
+    @shared_task(name="accounts.cleanup_expired_otps", queue="maintenance_transient")
     def cleanup_expired_otps():
         updated_count = User.objects.filter(otp_expires_at__lt=timezone.now()).update(
             otp_code=None, otp_expires_at=None
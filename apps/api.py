@@ -9,6 +9,7 @@ from apps.common.exceptions import (
     request_errors,
     validation_errors,
 )
+from apps.common.responses import CompactJSONRenderer
 
 from apps.accounts.views import auth_router
 from apps.profiles.views import profiles_router
@@ -72,6 +73,7 @@ Django 5.2 + Django Ninja | PostgreSQL 16 | Redis | Celery + RabbitMQ | Promethe
     """,
     version="1.0.0",
     docs_url="/",
+    renderer=CompactJSONRenderer(),
     throttle=[
         # Anonymous users: 5000 requests per minute
         AnonRateThrottle("10000/m"),
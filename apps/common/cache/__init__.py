@@ -1,4 +1,4 @@
 from .decorators import cacheable, invalidate_cache
-from .manager import CacheManager
+from .manager import CacheManager, get_async_redis
 
-__all__ = ["cacheable", "invalidate_cache", "CacheManager"]
+__all__ = ["cacheable", "invalidate_cache", "CacheManager", "get_async_redis"]
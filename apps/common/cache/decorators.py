@@ -122,10 +122,10 @@ def cacheable(
                             f"[Cache] {operation.view_func.__name__} | Path: {path_params} | Query: {query_string[:50]} | Key: {cache_key}"
                         )
 
-                    cached_response = CacheManager.get(cache_key)
+                    cached_response = await CacheManager.aget(cache_key)
                     if cached_response is not None:
                         if debug:
-                            logger.info(f"[Cache] HIT: {cache_key}")
+                            logger.info("[Cache] HIT: %s", cache_key)
                         response = HttpResponse(
                             content=cached_response["content"],
                             status=cached_response["status"],
@@ -134,7 +134,7 @@ def cacheable(
                         return response
 
                     if debug:
-                        logger.info(f"[Cache] MISS: {cache_key}")
+                        logger.info("[Cache] MISS: %s", cache_key)
 
                     result = await original_run(request, **kw)
 
@@ -151,8 +151,8 @@ def cacheable(
                             ),
                         }
                         if debug:
-                            logger.info(f"[Cache] SET: {cache_key} (TTL: {ttl}s)")
-                        CacheManager.set(cache_key, cache_data, ttl)
+                            logger.info("[Cache] SET: %s (TTL: %ss)", cache_key, ttl)
+                        await CacheManager.aset(cache_key, cache_data, ttl)
 
                     return result
 
@@ -217,7 +217,7 @@ def cacheable(
                     cached_response = CacheManager.get(cache_key)
                     if cached_response is not None:
                         if debug:
-                            logger.info(f"[Cache] HIT: {cache_key}")
+                            logger.info("[Cache] HIT: %s", cache_key)
                         response = HttpResponse(
                             content=cached_response["content"],
                             status=cached_response["status"],
@@ -226,7 +226,7 @@ def cacheable(
                         return response
 
                     if debug:
-                        logger.info(f"[Cache] MISS: {cache_key}")
+                        logger.info("[Cache] MISS: %s", cache_key)
 
                     result = original_run(request, **kw)
 
@@ -243,7 +243,7 @@ def cacheable(
                             ),
                         }
                         if debug:
-                            logger.info(f"[Cache] SET: {cache_key} (TTL: {ttl}s)")
+                            logger.info("[Cache] SET: %s (TTL: %ss)", cache_key, ttl)
                         CacheManager.set(cache_key, cache_data, ttl)
 
                     return result
@@ -330,7 +330,7 @@ def invalidate_cache(patterns: List[str], debug: bool = False):
                 if debug:
                     logger.info(f"[Cache Invalidate] Pattern: {resolved_pattern}")
 
-                deleted_count = CacheManager.delete_pattern(resolved_pattern)
+                deleted_count = await CacheManager.adelete_pattern(resolved_pattern)
                 total_deleted += deleted_count
 
                 if debug:
@@ -4,14 +4,70 @@ from django.conf import settings
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db.models import Model
 from django_redis import get_redis_connection
-import json, hashlib, logging
-from django.forms.models import model_to_dict
+from cachetools import TTLCache
+from redis import asyncio as aioredis
+from functools import lru_cache
+from itertools import chain
+import json, hashlib, logging, threading, fnmatch, time, zlib, re
 
 logger = logging.getLogger(__name__)
 
+# Per-process L1 cache in front of Redis (L2). The short TTL bounds how stale
+# an entry can get when another process invalidates the Redis copy.
+_L1_CACHE = TTLCache(maxsize=1024, ttl=5)
+_L1_LOCK = threading.RLock()
+
+# Lazily created asyncio Redis client used by the a* methods so async views
+# don't block the event loop on cache round-trips.
+_ASYNC_REDIS: Optional[aioredis.Redis] = None
+
+# Stampede protection for get_or_set: one caller recomputes a missing key
+# while the others back off and re-read.
+RECOMPUTE_LOCK_TTL = 30
+RECOMPUTE_BACKOFF_DELAYS = (0.01, 0.02, 0.04)
+
+# Payloads above this size are zlib-compressed before being written to Redis.
+# Stored values carry a one-byte marker so either form can be read back.
+COMPRESSION_THRESHOLD = 1024
+RAW_MARKER = b"\x00"
+COMPRESSED_MARKER = b"\x01"
+
+PLACEHOLDER_RE = re.compile(r"{{(\w+)}}")
+
+
+def get_async_redis() -> aioredis.Redis:
+    """Shared asyncio Redis client on the default cache's Redis instance"""
+    global _ASYNC_REDIS
+    if _ASYNC_REDIS is None:
+        _ASYNC_REDIS = aioredis.Redis.from_url(
+            settings.CACHES["default"]["LOCATION"], max_connections=50
+        )
+    return _ASYNC_REDIS
+
+
+@lru_cache(maxsize=None)
+def _cacheable_fields(model: type[Model]) -> tuple:
+    """Fields serialized for a model, resolved once per model class.
+
+    Mirrors the field selection of ``django.forms.models.model_to_dict`` so the
+    cached payload shape is unchanged.
+    """
+    opts = model._meta
+    return tuple(
+        field
+        for field in chain(opts.concrete_fields, opts.private_fields, opts.many_to_many)
+        if getattr(field, "editable", False)
+    )
+
 
 class CacheManager:
-    """Centralized cache management for Redis operations."""
+    """
+    Centralized cache management for Redis operations.
+
+    All operations address the exact key they are given (e.g. the
+    `paycore:...` keys built by `build_key` and `@cacheable`), so reads,
+    writes and pattern invalidation always agree on where a value lives.
+    """
 
     @staticmethod
     def _prepare_for_cache(value: Any) -> Any:
@@ -43,17 +99,12 @@ class CacheManager:
     @staticmethod
     def _model_to_dict(instance: Model) -> dict:
         """Convert Django model instance to dictionary."""
-        data = model_to_dict(instance)
-
-        if "id" not in data:
-            data["id"] = str(instance.pk)
-        else:
-            data["id"] = str(data["id"])
-
-        for key, value in data.items():
-            if hasattr(value, "hex"):
-                data[key] = str(value)
+        data = {}
+        for field in _cacheable_fields(type(instance)):
+            value = field.value_from_object(instance)
+            data[field.name] = str(value) if hasattr(value, "hex") else value
 
+        data["id"] = str(data["id"]) if "id" in data else str(instance.pk)
         return data
 
     @staticmethod
@@ -62,18 +113,63 @@ class CacheManager:
         sorted_params = json.dumps(params, sort_keys=True, default=str)
         return hashlib.md5(sorted_params.encode()).hexdigest()
 
+    @staticmethod
+    def _l1_get(key: str) -> Optional[Any]:
+        with _L1_LOCK:
+            return _L1_CACHE.get(key)
+
+    @staticmethod
+    def _l1_set(key: str, value: Any) -> None:
+        with _L1_LOCK:
+            _L1_CACHE[key] = value
+
+    @staticmethod
+    def _l1_evict(key: str) -> None:
+        with _L1_LOCK:
+            _L1_CACHE.pop(key, None)
+
+    @staticmethod
+    def _l1_evict_pattern(pattern: str) -> None:
+        with _L1_LOCK:
+            stale_keys = [
+                k for k in _L1_CACHE.keys() if fnmatch.fnmatchcase(k, pattern)
+            ]
+            for key in stale_keys:
+                _L1_CACHE.pop(key, None)
+
+    @staticmethod
+    def _encode(value: Any) -> bytes:
+        """Serialize a value to JSON, compressing it when it is large."""
+        prepared_value = CacheManager._prepare_for_cache(value)
+        payload = json.dumps(prepared_value, cls=DjangoJSONEncoder).encode()
+        if len(payload) > COMPRESSION_THRESHOLD:
+            return COMPRESSED_MARKER + zlib.compress(payload, 1)
+        return RAW_MARKER + payload
+
+    @staticmethod
+    def _decode(payload: bytes) -> Any:
+        """Inverse of `_encode`; unmarked payloads are treated as plain JSON."""
+        marker = payload[:1]
+        if marker == COMPRESSED_MARKER:
+            return json.loads(zlib.decompress(payload[1:]))
+        if marker == RAW_MARKER:
+            return json.loads(payload[1:])
+        return json.loads(payload)
+
     @staticmethod
     def get(key: str) -> Optional[Any]:
-        """Retrieve value from cache."""
+        """Retrieve value from cache, checking the in-process L1 before Redis."""
+        value = CacheManager._l1_get(key)
+        if value is not None:
+            return value
+
         try:
             redis_client = get_redis_connection("default")
-            cache_prefix = getattr(settings, "CACHE_KEY_PREFIX", "paycore")
-            full_key = f":{cache_prefix}:{key}:1" if not key.startswith(":") else key
+            payload = redis_client.get(key)
 
-            cached_json = redis_client.get(full_key)
-
-            if cached_json is not None:
-                value = json.loads(cached_json)
+            if payload is not None:
+                value = CacheManager._decode(payload)
+                CacheManager._l1_set(key, value)
                 return value
 
             return None
@@ -85,13 +181,12 @@ class CacheManager:
     def set(key: str, value: Any, ttl: int = 300) -> bool:
         """Store value in cache."""
         try:
-            prepared_value = CacheManager._prepare_for_cache(value)
-            json_value = json.dumps(prepared_value, cls=DjangoJSONEncoder)
-
+            payload = CacheManager._encode(value)
             redis_client = get_redis_connection("default")
-            redis_client.setex(key, ttl, json_value)
+            redis_client.setex(key, ttl, payload)
+            CacheManager._l1_evict(key)
 
-            logger.debug(f"Cache SET: {key} (TTL: {ttl}s)")
+            logger.debug("Cache SET: %s (TTL: %ss)", key, ttl)
             return True
         except Exception as e:
             logger.error(f"Cache SET error for key '{key}': {e}")
@@ -100,9 +195,10 @@ class CacheManager:
     @staticmethod
     def delete(key: str) -> bool:
         """Delete a specific key from cache."""
+        CacheManager._l1_evict(key)
         try:
-            cache.delete(key)
-            logger.debug(f"Cache DELETE: {key}")
+            get_redis_connection("default").delete(key)
+            logger.debug("Cache DELETE: %s", key)
             return True
         except Exception as e:
             logger.error(f"Cache DELETE error for key '{key}': {e}")
@@ -111,17 +207,20 @@ class CacheManager:
     @staticmethod
     def delete_pattern(pattern: str) -> int:
         """Delete all keys matching a pattern."""
+        CacheManager._l1_evict_pattern(pattern)
         try:
             redis_conn = get_redis_connection("default")
             keys = redis_conn.keys(pattern)
 
             if not keys:
-                logger.debug(f"No keys found for pattern: {pattern}")
+                logger.debug("No keys found for pattern: %s", pattern)
                 return 0
 
             deleted_count = redis_conn.delete(*keys)
             logger.info(
-                f"Cache INVALIDATE: {deleted_count} keys deleted for pattern '{pattern}'"
+                "Cache INVALIDATE: %s keys deleted for pattern '%s'",
+                deleted_count,
+                pattern,
             )
             return deleted_count
 
@@ -135,9 +234,80 @@ class CacheManager:
             logger.error(f"Cache DELETE_PATTERN error for pattern '{pattern}': {e}")
             return 0
 
+    @staticmethod
+    async def aget(key: str) -> Optional[Any]:
+        """Async variant of `get` using the asyncio Redis client."""
+        value = CacheManager._l1_get(key)
+        if value is not None:
+            return value
+
+        try:
+            payload = await get_async_redis().get(key)
+
+            if payload is not None:
+                value = CacheManager._decode(payload)
+                CacheManager._l1_set(key, value)
+                return value
+
+            return None
+        except Exception as e:
+            logger.error(f"Cache AGET error for key '{key}': {e}")
+            return None
+
+    @staticmethod
+    async def aset(key: str, value: Any, ttl: int = 300) -> bool:
+        """Async variant of `set` using the asyncio Redis client."""
+        try:
+            payload = CacheManager._encode(value)
+            await get_async_redis().setex(key, ttl, payload)
+            CacheManager._l1_evict(key)
+
+            logger.debug("Cache SET: %s (TTL: %ss)", key, ttl)
+            return True
+        except Exception as e:
+            logger.error(f"Cache ASET error for key '{key}': {e}")
+            return False
+
+    @staticmethod
+    async def adelete(key: str) -> bool:
+        """Async variant of `delete` using the asyncio Redis client."""
+        CacheManager._l1_evict(key)
+        try:
+            await get_async_redis().delete(key)
+            logger.debug("Cache DELETE: %s", key)
+            return True
+        except Exception as e:
+            logger.error(f"Cache ADELETE error for key '{key}': {e}")
+            return False
+
+    @staticmethod
+    async def adelete_pattern(pattern: str) -> int:
+        """Async variant of `delete_pattern` using the asyncio Redis client."""
+        CacheManager._l1_evict_pattern(pattern)
+        try:
+            redis_client = get_async_redis()
+            keys = await redis_client.keys(pattern)
+
+            if not keys:
+                logger.debug("No keys found for pattern: %s", pattern)
+                return 0
+
+            deleted_count = await redis_client.delete(*keys)
+            logger.info(
+                "Cache INVALIDATE: %s keys deleted for pattern '%s'",
+                deleted_count,
+                pattern,
+            )
+            return deleted_count
+        except Exception as e:
+            logger.error(f"Cache ADELETE_PATTERN error for pattern '{pattern}': {e}")
+            return 0
+
     @staticmethod
     def clear_all() -> bool:
         """Clear all cache entries."""
+        with _L1_LOCK:
+            _L1_CACHE.clear()
         try:
             cache.clear()
             logger.warning("Cache CLEAR: All cache entries cleared")
@@ -171,19 +341,17 @@ class CacheManager:
             ... )
             'loans:products:NGN:a1b2c3d4'
         """
-        resolved_key = key_template
-
-        for key, value in context.items():
-            placeholder = f"{{{{{key}}}}}"
-            if placeholder in resolved_key:
-                if hash_params and key in hash_params:
-                    if isinstance(value, (dict, list)):
-                        hashed_value = CacheManager._hash_params({key: value})
-                        resolved_key = resolved_key.replace(placeholder, hashed_value)
-                    else:
-                        resolved_key = resolved_key.replace(placeholder, str(value))
-                else:
-                    resolved_key = resolved_key.replace(placeholder, str(value))
+
+        def _resolve(match: re.Match) -> str:
+            name = match.group(1)
+            if name not in context:
+                return match.group(0)
+            value = context[name]
+            if hash_params and name in hash_params and isinstance(value, (dict, list)):
+                return CacheManager._hash_params({name: value})
+            return str(value)
+
+        resolved_key = PLACEHOLDER_RE.sub(_resolve, key_template)
 
         cache_prefix = getattr(settings, "CACHE_KEY_PREFIX", "paycore")
         return f"{cache_prefix}:{resolved_key}"
@@ -196,12 +364,40 @@ class CacheManager:
         *args,
         **kwargs,
     ) -> Any:
-        """Get value from cache or compute and cache it."""
+        """
+        Get value from cache or compute and cache it.
+
+        On a miss only the caller that wins a `SET NX EX` lock runs the
+        callback; concurrent callers back off briefly and re-read the key,
+        falling back to computing it themselves if it still isn't there.
+        """
         cached_value = CacheManager.get(key)
         if cached_value is not None:
             return cached_value
 
-        computed_value = callback(*args, **kwargs)
-        CacheManager.set(key, computed_value, ttl)
+        lock_key = f"{key}:lock"
+        try:
+            redis_client = get_redis_connection("default")
+            acquired = redis_client.set(lock_key, "1", ex=RECOMPUTE_LOCK_TTL, nx=True)
+        except Exception as e:
+            logger.error(f"Cache LOCK error for key '{key}': {e}")
+            redis_client, acquired = None, True
+
+        if not acquired:
+            for delay in RECOMPUTE_BACKOFF_DELAYS:
+                time.sleep(delay)
+                cached_value = CacheManager.get(key)
+                if cached_value is not None:
+                    return cached_value
+
+        try:
+            computed_value = callback(*args, **kwargs)
+            CacheManager.set(key, computed_value, ttl)
+        finally:
+            if acquired and redis_client is not None:
+                try:
+                    redis_client.delete(lock_key)
+                except Exception as e:
+                    logger.error(f"Cache UNLOCK error for key '{key}': {e}")
 
         return computed_value
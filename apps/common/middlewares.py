@@ -1,7 +1,25 @@
-from django.http import JsonResponse
+from django.http import HttpResponse
 from django.utils.deprecation import MiddlewareMixin
-
-ALLOWED_CLIENT_TYPES = ["web", "mobile"]
+import json
+
+ALLOWED_CLIENT_TYPES = frozenset(("web", "mobile"))
+BROWSER_USER_AGENT_MARKERS = (
+    "mozilla",
+    "chrome",
+    "safari",
+    "edge",
+    "firefox",
+    "opera",
+)
+
+# Serialized once; a fresh HttpResponse is still built per request since
+# downstream middleware mutates response headers.
+INVALID_CLIENT_TYPE_CONTENT = json.dumps(
+    {
+        "status": "failure",
+        "message": f"Invalid X-Client-Type header. Allowed: {', '.join(sorted(ALLOWED_CLIENT_TYPES))}",
+    }
+).encode()
 
 
 class SecurityHeadersMiddleware(MiddlewareMixin):
@@ -61,33 +79,22 @@ class ClientTypeMiddleware:
 
     def __call__(self, request):
         # Get client type from header or detect from user agent
-        client_type = request.headers.get("X-Client-Type", "").lower()
-        user_agent = request.META.get("HTTP_USER_AGENT", "").lower()
+        client_type = request.headers.get("X-Client-Type")
 
         # If explicit client type provided, validate it
         if client_type:
+            client_type = client_type.lower()
             if client_type not in ALLOWED_CLIENT_TYPES:
-                return JsonResponse(
-                    {
-                        "status": "failure",
-                        "message": f"Invalid X-Client-Type header. Allowed: {', '.join(ALLOWED_CLIENT_TYPES)}",
-                    },
+                return HttpResponse(
+                    INVALID_CLIENT_TYPE_CONTENT,
+                    content_type="application/json",
                     status=400,
                 )
             request.client_type = client_type
         else:
             # Auto-detect based on user agent for backward compatibility
-            if any(
-                browser in user_agent
-                for browser in [
-                    "mozilla",
-                    "chrome",
-                    "safari",
-                    "edge",
-                    "firefox",
-                    "opera",
-                ]
-            ):
+            user_agent = request.META.get("HTTP_USER_AGENT", "").lower()
+            if any(browser in user_agent for browser in BROWSER_USER_AGENT_MARKERS):
                 request.client_type = "web"
             else:
                 request.client_type = "mobile"
@@ -1,9 +1,17 @@
-from typing import Any, List
+from datetime import datetime
+from typing import Any, List, Optional
+from uuid import UUID
+from django.core.paginator import Paginator as DjangoPaginator
+from django.db import connections
+from django.db.models import Q, QuerySet
+from django.utils.functional import cached_property
 from ninja.pagination import PaginationBase
 from ninja import Schema
-from asgiref.sync import sync_to_async
+from apps.common.cache import CacheManager
 from apps.common.exceptions import RequestError, ErrorCode
-import math
+import base64, hashlib, json, logging, math
+
+logger = logging.getLogger(__name__)
 
 
 class CustomPagination(PaginationBase):
@@ -13,18 +21,101 @@ class CustomPagination(PaginationBase):
         limit: int
         page: int
         total_pages: int
+        next_cursor: Optional[str] = None
+
+    @staticmethod
+    async def estimated_count(queryset) -> int:
+        """
+        Row estimate from the Postgres planner (EXPLAIN, no execution).
+        Much cheaper than COUNT(*) on large tables; falls back to an exact
+        count if the plan can't be read.
+        """
+        output = await queryset.aexplain(format="json")
+        try:
+            return CustomPagination.plan_rows(output)
+        except (ValueError, KeyError, IndexError, TypeError) as e:
+            logger.warning(f"Could not read planner row estimate: {e}")
+            return await queryset.acount()
+
+    @staticmethod
+    def plan_rows(explain_output: str) -> int:
+        """
+        Top-level "Plan Rows" from EXPLAIN (FORMAT JSON) output. Django
+        re-serializes each element of the plan row, so the text is normally
+        the bare {"Plan": ...} object; a raw [{"Plan": ...}] list is accepted too.
+        """
+        plan = json.loads(explain_output)
+        if isinstance(plan, list):
+            plan = plan[0]
+        return int(plan["Plan"]["Plan Rows"])
+
+    @staticmethod
+    def encode_cursor(item) -> str:
+        raw = f"{item.created_at.isoformat()}|{item.pk}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str):
+        try:
+            created_at, pk = (
+                base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+            )
+            return datetime.fromisoformat(created_at), UUID(pk)
+        except Exception:
+            raise RequestError(
+                err_code=ErrorCode.INVALID_PAGE,
+                err_msg="Invalid cursor",
+                status_code=400,
+            )
 
-    async def paginate_queryset(self, queryset, current_page, limit=50):
+    async def paginate_queryset(
+        self,
+        queryset,
+        current_page,
+        limit=50,
+        fast_count=False,
+        keyset=False,
+        cursor: Optional[str] = None,
+    ):
+        """
+        Offset pagination by default. With keyset=True the queryset is ordered
+        newest first by (created_at, pk) and each full page carries a
+        next_cursor; passing it back as cursor seeks past that row instead of
+        scanning an OFFSET, and the total becomes the planner estimate.
+        """
+        if keyset:
+            queryset = queryset.order_by("-created_at", "-pk")
+            if cursor:
+                return await self.paginate_after_cursor(
+                    queryset, current_page, limit, cursor
+                )
         if current_page < 1:
             raise RequestError(
                 err_code=ErrorCode.INVALID_PAGE,
                 err_msg="Invalid Page",
                 status_code=404,
             )
-        async_queryset = await sync_to_async(list)(queryset)
-        queryset_count = await queryset.acount()
-        items = async_queryset[(current_page - 1) * limit : current_page * limit]
-        if queryset_count > 0 and not items:
+        # Slice in SQL (LIMIT/OFFSET) so only the requested page is fetched;
+        # async iteration still runs any prefetch_related lookups for the page
+        offset = (current_page - 1) * limit
+        items = [item async for item in queryset[offset : offset + limit]]
+
+        if len(items) < limit and (items or current_page == 1):
+            # A short page is the last one, so the total is exact without
+            # a COUNT(*); most user-scoped lists fit on the first page
+            queryset_count = offset + len(items)
+            page_out_of_range = False
+        elif fast_count:
+            # Never report fewer rows than this page proves exist
+            queryset_count = max(
+                await self.estimated_count(queryset), offset + len(items)
+            )
+            page_out_of_range = not items and current_page > 1
+        else:
+            queryset_count = await queryset.acount()
+            page_out_of_range = queryset_count > 0 and not items
+
+        if page_out_of_range:
             raise RequestError(
                 err_code=ErrorCode.INVALID_PAGE,
                 err_msg="Page number is out of range",
@@ -37,7 +128,70 @@ class CustomPagination(PaginationBase):
             "limit": limit,
             "page": current_page,
             "total_pages": last_page,
+            "next_cursor": (
+                self.encode_cursor(items[-1])
+                if keyset and len(items) == limit
+                else None
+            ),
+        }
+
+    async def paginate_after_cursor(self, queryset, current_page, limit, cursor):
+        created_at, pk = self.decode_cursor(cursor)
+        # The created_at bound alone is index-friendly; the OR breaks ties
+        page = queryset.filter(created_at__lte=created_at).filter(
+            Q(created_at__lt=created_at) | Q(pk__lt=pk)
+        )
+        items = [item async for item in page[:limit]]
+        queryset_count = await self.estimated_count(queryset)
+        return {
+            "items": items,
+            "total": queryset_count,
+            "limit": limit,
+            "page": current_page,
+            "total_pages": max(1, math.ceil(queryset_count / limit)),
+            "next_cursor": (
+                self.encode_cursor(items[-1]) if len(items) == limit else None
+            ),
         }
 
 
 Paginator = CustomPagination()
+
+
+class FastCountPaginator(DjangoPaginator):
+    """
+    Admin changelist paginator for large tables.
+
+    Unfiltered changelists read the row estimate Postgres keeps in pg_class
+    instead of running COUNT(*); filtered counts are exact but cached
+    briefly per query. Use with `show_full_result_count = False`.
+    """
+
+    # Below this many rows an exact count is cheap and the estimate may be stale
+    ESTIMATE_THRESHOLD = 10000
+    COUNT_CACHE_TTL = 60
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if not isinstance(queryset, QuerySet):
+            return super().count
+
+        if not queryset.query.where:
+            with connections[queryset.db].cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                    [queryset.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+            if row and row[0] >= self.ESTIMATE_THRESHOLD:
+                return row[0]
+
+        sql, params = queryset.query.sql_with_params()
+        digest = hashlib.md5(f"{sql}:{params}".encode()).hexdigest()
+        key = f"paycore:admin:count:{queryset.model._meta.db_table}:{digest}"
+        count = CacheManager.get(key)
+        if count is None:
+            count = queryset.count()
+            CacheManager.set(key, count, ttl=self.COUNT_CACHE_TTL)
+        return count
@@ -1,28 +1,38 @@
+from ninja.renderers import JSONRenderer
 from ninja.responses import Response
 
 
+class CompactJSONRenderer(JSONRenderer):
+    """
+    Default ninja JSON rendering without the whitespace after separators and
+    without the circular-reference check (validated schema output is a tree)
+    """
+
+    json_dumps_params = {"separators": (",", ":"), "check_circular": False}
+
+
 class CustomResponse:
     @staticmethod
     def success(message, data=None, status_code=200, og_resp=False):
-        response_data = {
-            "status": "success",
-            "message": message,
-            "data": data,
-        }
         if data is None:
-            response_data.pop("data", None)
+            response_data = {"status": "success", "message": message}
+        else:
+            response_data = {"status": "success", "message": message, "data": data}
         if og_resp:
             return Response(response_data, status=status_code)
         return status_code, response_data
 
     @staticmethod
     def error(message, err_code, data=None, status_code=400):
-        response = {
+        if data is None:
+            return status_code, {
+                "status": "failure",
+                "message": message,
+                "code": err_code,
+            }
+        return status_code, {
             "status": "failure",
             "message": message,
             "code": err_code,
             "data": data,
         }
-        if data is None:
-            response.pop("data", None)
-        return status_code, response
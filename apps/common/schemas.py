@@ -20,6 +20,7 @@ class PaginatedResponseDataSchema(BaseSchema):
     limit: int
     page: int
     total_pages: int
+    next_cursor: str | None = None
 
 
 class UserDataSchema(BaseSchema):
@@ -30,3 +31,7 @@ class UserDataSchema(BaseSchema):
 class PaginationQuerySchema(BaseSchema):
     page: int = Field(1, ge=1, description="Page number for pagination")
     limit: int = Field(50, ge=1, le=100, description="Number of items per page")
+    cursor: str | None = Field(
+        None,
+        description="next_cursor from the previous page; seeks past it instead of using page",
+    )
@@ -0,0 +1,129 @@
+"""
+Unit tests for the shared paginator (apps/common/paginators.py)
+
+Covers the planner row estimate used by fast_count pagination and
+keyset (cursor) pagination.
+"""
+
+import json
+import pytest
+from datetime import datetime, UTC
+from unittest.mock import AsyncMock, Mock, patch
+
+from apps.common.exceptions import RequestError
+from apps.common.paginators import CustomPagination, Paginator
+from apps.notifications.models import Notification
+
+
+def django_explain_output(plan_row):
+    """Format a parsed EXPLAIN (FORMAT JSON) row the way Django's explain_query does"""
+    return " ".join(json.dumps(element) for element in plan_row)
+
+
+@pytest.mark.unit
+class TestPlanRows:
+    """Test reading the row estimate out of EXPLAIN output."""
+
+    def test_reads_django_formatted_plan(self):
+        """Django yields the bare {"Plan": ...} object, not a list."""
+        output = django_explain_output([{"Plan": {"Plan Rows": 1234}}])
+        assert output.startswith("{")
+        assert CustomPagination.plan_rows(output) == 1234
+
+    def test_reads_unwrapped_plan_list(self):
+        """A raw [{"Plan": ...}] list is accepted too."""
+        output = json.dumps([{"Plan": {"Plan Rows": 42}}])
+        assert CustomPagination.plan_rows(output) == 42
+
+    def test_malformed_plan_raises(self):
+        with pytest.raises(KeyError):
+            CustomPagination.plan_rows(json.dumps({"Rows": 1}))
+
+
+@pytest.mark.unit
+class TestEstimatedCount:
+    """Test that fast counts avoid COUNT(*) when the plan is readable."""
+
+    async def test_uses_plan_estimate_without_counting(self):
+        queryset = Mock()
+        queryset.aexplain = AsyncMock(
+            return_value=django_explain_output([{"Plan": {"Plan Rows": 5000}}])
+        )
+        queryset.acount = AsyncMock(return_value=1)
+
+        assert await CustomPagination.estimated_count(queryset) == 5000
+        queryset.acount.assert_not_awaited()
+
+    async def test_falls_back_to_exact_count_on_unreadable_plan(self):
+        queryset = Mock()
+        queryset.aexplain = AsyncMock(return_value="not json")
+        queryset.acount = AsyncMock(return_value=7)
+
+        assert await CustomPagination.estimated_count(queryset) == 7
+        queryset.acount.assert_awaited_once()
+
+
+@pytest.mark.unit
+class TestKeysetPagination:
+    """Test walking a list with next_cursor."""
+
+    @pytest.mark.django_db(transaction=True)
+    async def test_cursor_pages_have_no_duplicates_or_gaps_on_ties(self, verified_user):
+        """Rows sharing a created_at are split across pages by pk."""
+        await Notification.objects.abulk_create(
+            [
+                Notification(user=verified_user, title=f"N{i}", message="Test")
+                for i in range(5)
+            ]
+        )
+        tied = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+        await Notification.objects.filter(user=verified_user).aupdate(created_at=tied)
+        queryset = Notification.objects.filter(user=verified_user)
+
+        first = await Paginator.paginate_queryset(queryset, 1, limit=2, keyset=True)
+        assert first["next_cursor"]
+
+        seen = [n.id for n in first["items"]]
+        cursor = first["next_cursor"]
+        with patch.object(
+            CustomPagination, "estimated_count", AsyncMock(return_value=5)
+        ):
+            while cursor:
+                page = await Paginator.paginate_queryset(
+                    queryset, 1, limit=2, keyset=True, cursor=cursor
+                )
+                seen.extend(n.id for n in page["items"])
+                cursor = page["next_cursor"]
+
+        expected = [n.id async for n in queryset.order_by("-created_at", "-pk")]
+        assert len(seen) == len(set(seen))
+        assert seen == expected
+
+    @pytest.mark.django_db(transaction=True)
+    async def test_cursor_page_does_not_count_rows(self, verified_user):
+        """Cursor pages report the planner estimate instead of COUNT(*)."""
+        await Notification.objects.abulk_create(
+            [
+                Notification(user=verified_user, title=f"N{i}", message="Test")
+                for i in range(3)
+            ]
+        )
+        queryset = Notification.objects.filter(user=verified_user)
+        first = await Paginator.paginate_queryset(queryset, 1, limit=1, keyset=True)
+
+        with patch.object(
+            CustomPagination, "estimated_count", AsyncMock(return_value=3)
+        ) as estimated_count, patch(
+            "django.db.models.query.QuerySet.acount", AsyncMock()
+        ) as acount:
+            page = await Paginator.paginate_queryset(
+                queryset, 1, limit=1, keyset=True, cursor=first["next_cursor"]
+            )
+
+        assert page["total"] == 3
+        estimated_count.assert_awaited_once()
+        acount.assert_not_awaited()
+
+    def test_invalid_cursor_rejected(self):
+        with pytest.raises(RequestError):
+            CustomPagination.decode_cursor("not-a-cursor")
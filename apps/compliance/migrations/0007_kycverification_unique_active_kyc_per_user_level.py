@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-16 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("compliance", "0006_alter_amlcheck_deleted_at_and_more"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="kycverification",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(
+                    ("status__in", ["pending", "under_review", "approved"])
+                ),
+                fields=("user", "level"),
+                name="unique_active_kyc_per_user_level",
+            ),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.6 on 2026-10-16 09:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("compliance", "0007_kycverification_unique_active_kyc_per_user_level"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="kycverification",
+            index=models.Index(
+                fields=["user", "status", "-level"], name="kyc_user_status_level_idx"
+            ),
+        ),
+    ]
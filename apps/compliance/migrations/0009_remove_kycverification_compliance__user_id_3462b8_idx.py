@@ -0,0 +1,17 @@
+# Generated by Django 5.2.6 on 2026-10-16 14:12
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("compliance", "0008_kycverification_kyc_user_status_level_idx"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="kycverification",
+            name="compliance__user_id_3462b8_idx",
+        ),
+    ]
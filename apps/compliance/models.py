@@ -124,10 +124,29 @@ class KYCVerification(BaseModel):
     class Meta:
         ordering = ["-created_at"]
         indexes = [
-            models.Index(fields=["user", "status"]),
             models.Index(fields=["status", "level"]),
+            # Highest approved level per user (index-only scan); also serves
+            # plain (user, status) filters as its leading columns
+            models.Index(
+                fields=["user", "status", "-level"], name="kyc_user_status_level_idx"
+            ),
             models.Index(fields=["document_number"]),
         ]
+        constraints = [
+            # At most one live (pending/under review/approved) verification per
+            # user and level; lets submit_kyc insert without a pre-check query.
+            models.UniqueConstraint(
+                fields=["user", "level"],
+                condition=models.Q(
+                    status__in=[
+                        KYCStatus.PENDING,
+                        KYCStatus.UNDER_REVIEW,
+                        KYCStatus.APPROVED,
+                    ]
+                ),
+                name="unique_active_kyc_per_user_level",
+            )
+        ]
 
     def __str__(self):
         return f"KYC {self.kyc_id} - {self.user.email} ({self.status})"
@@ -87,6 +87,17 @@ class KYCDocumentSchema(ModelSchema):
         ]
 
 
+class UploadKYCDocumentsSchema(BaseSchema):
+    """Document type of each uploaded file, in upload order"""
+
+    document_types: List[DocumentType] = Field(..., min_length=1)
+
+
+class KYCDocumentListDataResponseSchema(BaseSchema):
+    message: str
+    data: List[KYCDocumentSchema]
+
+
 class KYCVerificationSchema(ModelSchema):
     user: UserSchema
     documents: List[KYCDocumentSchema] = []
@@ -1,8 +1,12 @@
+import functools
+from django.db import IntegrityError, transaction
+from django.db.models import prefetch_related_objects
 from django.utils import timezone
-from typing import Optional
+from types import MappingProxyType
+from typing import List, Optional
 
 from apps.accounts.models import User
-from apps.common.decorators import aatomic
+from apps.common.decorators import aatomic, AsyncAtomicContextManager
 from apps.common.exceptions import (
     BodyValidationError,
     NotFoundError,
@@ -19,7 +23,8 @@ from apps.compliance.schemas import CreateKYCSchema, UpdateKYCStatusSchema
 from apps.common.schemas import PaginationQuerySchema
 from apps.common.paginators import Paginator
 from asgiref.sync import sync_to_async
-from apps.profiles.models import Country
+from apps.profiles.services import CountryCache
+from apps.wallets.models import Wallet
 from apps.wallets.services.wallet_manager import WalletManager
 from apps.wallets.schemas import CreateWalletSchema
 from apps.notifications.services.dispatcher import (
@@ -29,6 +34,15 @@ from apps.notifications.services.dispatcher import (
 )
 from apps.notifications.models import NotificationPriority
 
+# Ordering of KYC tiers (levels are stored as strings)
+KYC_LEVEL_RANKS = MappingProxyType(
+    {
+        KYCLevel.TIER_1: 1,
+        KYCLevel.TIER_2: 2,
+        KYCLevel.TIER_3: 3,
+    }
+)
+
 
 class KYCManager:
     """Service for managing KYC verifications"""
@@ -38,47 +52,60 @@ class KYCManager:
     async def submit_kyc(
         user: User, data: CreateKYCSchema, id_document, selfie, proof_of_address=None
     ) -> KYCVerification:
-        # Validate country
-        country = await Country.objects.aget_or_none(id=data.country_id)
+        # Validate countries (served from the country cache after warm-up)
+        countries = await CountryCache.get_many(
+            [data.country_id, data.document_issuing_country_id]
+        )
+        country = countries.get(data.country_id)
         if not country:
             raise BodyValidationError("country_id", "Country not found")
 
-        document_issuing_country = await Country.objects.aget_or_none(
-            id=data.document_issuing_country_id
-        )
+        document_issuing_country = countries.get(data.document_issuing_country_id)
         if not document_issuing_country:
             raise BodyValidationError(
                 "document_issuing_country_id", "Document issuing country not found"
             )
 
-        existing_kyc = await KYCVerification.objects.filter(
-            user=user,
-            level=data.level,
-            status=[KYCStatus.PENDING, KYCStatus.UNDER_REVIEW, KYCStatus.APPROVED],
-        ).afirst()
-        if existing_kyc:
-            if existing_kyc.status == KYCStatus.APPROVED:
+        data_to_create = data.model_dump(
+            exclude_unset=True, exclude=["country_id", "document_issuing_country_id"]
+        )
+        # Create KYC verification. The partial unique constraint on
+        # (user, level) rejects duplicates of a live verification, so the
+        # existing record is only looked up when the insert conflicts.
+        try:
+            async with AsyncAtomicContextManager():
+                kyc = await KYCVerification.objects.acreate(
+                    user=user,
+                    country=country,
+                    document_issuing_country=document_issuing_country,
+                    selfie_image=selfie,
+                    **data_to_create,
+                )
+        except IntegrityError:
+            existing_status = (
+                await KYCVerification.objects.filter(
+                    user=user,
+                    level=data.level,
+                    status__in=[
+                        KYCStatus.PENDING,
+                        KYCStatus.UNDER_REVIEW,
+                        KYCStatus.APPROVED,
+                    ],
+                )
+                .values_list("status", flat=True)
+                .afirst()
+            )
+            if existing_status is None:
+                raise
+            if existing_status == KYCStatus.APPROVED:
                 raise RequestError(
                     ErrorCode.KYC_ALREADY_VERIFIED,
                     f"You already have an approved {data.level} verification",
                 )
-            else:
-                raise RequestError(
-                    ErrorCode.KYC_PENDING,
-                    f"You already have a pending {data.level} verification",
-                )
-
-        data_to_create = data.model_dump(
-            exclude_unset=True, exclude=["country_id", "document_issuing_country_id"]
-        )
-        # Create KYC verification
-        kyc = await KYCVerification.objects.acreate(
-            user=user,
-            country=country,
-            document_issuing_country=document_issuing_country,
-            selfie_image=selfie,
-            **data_to_create,
-        )
+            raise RequestError(
+                ErrorCode.KYC_PENDING,
+                f"You already have a pending {data.level} verification",
+            )
 
         # Create KYC documents in bulk
         documents_to_create = [
@@ -109,13 +136,16 @@ class KYCManager:
         user.first_name = kyc.first_name
         user.last_name = kyc.last_name
         user.dob = kyc.date_of_birth
-        await user.asave()
-
-        kyc = (
-            await KYCVerification.objects.select_related("user")
-            .prefetch_related("documents")
-            .aget(kyc_id=kyc.kyc_id)
+        await User.objects.filter(pk=user.pk).aupdate(
+            first_name=kyc.first_name,
+            last_name=kyc.last_name,
+            dob=kyc.date_of_birth,
+            updated_at=timezone.now(),
         )
+
+        # User and countries are already attached from acreate; only the
+        # documents relation needs loading for the response
+        await sync_to_async(prefetch_related_objects)([kyc], "documents")
         return kyc
 
     @staticmethod
@@ -136,18 +166,20 @@ class KYCManager:
     ):
         queryset = KYCVerification.objects.filter(user=user).select_related("user")
         if status:
-            queryset = queryset.filter(status__icontains=status)
-        kycs = await sync_to_async(list)(queryset.order_by("-created_at"))
+            # Status values are stored lowercase; an exact match can use the
+            # (user, status) index where icontains/iexact cannot
+            queryset = queryset.filter(status=status.lower())
+        kycs = [kyc async for kyc in queryset.order_by("-created_at")]
         return kycs
 
     @staticmethod
     async def get_user_current_kyc_level(user: User) -> Optional[str]:
-        kyc = (
+        return (
             await KYCVerification.objects.filter(user=user, status=KYCStatus.APPROVED)
             .order_by("-level")
+            .values_list("level", flat=True)
             .afirst()
         )
-        return kyc.level if kyc else None
 
     @staticmethod
     @aatomic
@@ -189,12 +221,11 @@ class KYCManager:
 
         # Automatically create NGN wallet when KYC is approved
         if data.status == KYCStatus.APPROVED:
-            # Check if user already has an NGN wallet
-            existing_ngn_wallets = await WalletManager.get_user_wallets(
-                user=kyc.user, currency_code="NGN"
-            )
+            has_ngn_wallet = await Wallet.objects.filter(
+                user=kyc.user, currency__code="NGN"
+            ).aexists()
 
-            if not existing_ngn_wallets:
+            if not has_ngn_wallet:
                 # Create NGN wallet for the user
                 wallet_data = CreateWalletSchema(
                     currency_code="NGN",
@@ -229,7 +260,11 @@ class KYCManager:
 
         if data.status in notification_map:
             notif_data = notification_map[data.status]
-            await sync_to_async(UnifiedNotificationDispatcher.dispatch)(
+            # Dispatch after commit: keeps the notification writes and the
+            # push/email provider calls out of the open transaction, and
+            # never notifies about a status change that was rolled back
+            notify = functools.partial(
+                UnifiedNotificationDispatcher.dispatch,
                 user=kyc.user,
                 event_type=notif_data["event_type"],
                 channels=[
@@ -245,6 +280,7 @@ class KYCManager:
                 related_object_id=str(kyc.kyc_id),
                 action_url="/settings/kyc",
             )
+            await sync_to_async(transaction.on_commit)(notify)
 
         return kyc
 
@@ -254,28 +290,35 @@ class KYCManager:
         level: Optional[str] = None,
         page_params: PaginationQuerySchema = None,
     ):
+        # KYCVerificationListSchema only renders `user`, so that is the only
+        # relation joined; add any relation the list schema starts rendering
+        # here (e.g. reviewed_by) to keep page rendering free of N+1 queries
         queryset = KYCVerification.objects.select_related("user")
         if status:
             queryset = queryset.filter(status=status)
         if level:
             queryset = queryset.filter(level=level)
+        # Unfiltered-by-status listings span the whole table, so use the
+        # planner's row estimate for the total instead of COUNT(*)
         return await Paginator.paginate_queryset(
-            queryset.order_by("-created_at"), page_params.page, page_params.limit
+            queryset.order_by("-created_at"),
+            page_params.page,
+            page_params.limit,
+            fast_count=not status,
         )
 
     @staticmethod
     async def check_kyc_requirement(user: User, required_level: str) -> bool:
-        kyc_levels = {
-            KYCLevel.TIER_1: 1,
-            KYCLevel.TIER_2: 2,
-            KYCLevel.TIER_3: 3,
-        }
-        user_level = await KYCManager.get_user_current_kyc_level(user)
+        # Memoized on the user instance (request.auth), so repeated checks
+        # within one request cost a single query
+        if not hasattr(user, "_current_kyc_level"):
+            user._current_kyc_level = await KYCManager.get_user_current_kyc_level(user)
+        user_level = user._current_kyc_level
         if not user_level:
             return False
-        user_level_value = kyc_levels.get(user_level, 0)
-        required_level_value = kyc_levels.get(required_level, 0)
-        return user_level_value >= required_level_value
+        return KYC_LEVEL_RANKS.get(user_level, 0) >= KYC_LEVEL_RANKS.get(
+            required_level, 0
+        )
 
     @staticmethod
     @aatomic
@@ -301,15 +344,55 @@ class KYCManager:
         return document
 
     @staticmethod
-    async def get_kyc_documents(user: User, kyc_id):
+    async def upload_kyc_documents_bulk(
+        user: User, kyc_id, document_types: List[str], files: list
+    ) -> List[KYCDocument]:
+        # Several documents in one call: the verification is fetched and
+        # validated once and the rows go in with a single bulk insert
+        if len(document_types) != len(files):
+            raise BodyValidationError(
+                "document_types", "Provide one document type per uploaded file"
+            )
         kyc = await KYCVerification.objects.aget_or_none(kyc_id=kyc_id, user=user)
         if not kyc:
             raise NotFoundError("KYC verification not found")
-        documents = await sync_to_async(list)(
-            KYCDocument.objects.filter(kyc_verification=kyc).order_by("-created_at")
+        if kyc.status not in [KYCStatus.PENDING, KYCStatus.UNDER_REVIEW]:
+            raise RequestError(
+                ErrorCode.KYC_INVALID_STATUS,
+                "Cannot upload documents to KYC verification with status: "
+                + kyc.status,
+            )
+        documents = await KYCDocument.objects.abulk_create(
+            [
+                KYCDocument(
+                    kyc_verification=kyc,
+                    document_type=document_type,
+                    file=file,
+                    file_name=file.name,
+                    file_size=file.size,
+                )
+                for document_type, file in zip(document_types, files)
+            ]
         )
         return documents
 
+    @staticmethod
+    async def get_kyc_documents(user: User, kyc_id):
+        documents = [
+            document
+            async for document in KYCDocument.objects.filter(
+                kyc_verification__kyc_id=kyc_id, kyc_verification__user=user
+            ).order_by("-created_at")
+        ]
+        # An empty result is ambiguous; only then check the verification exists
+        if not documents:
+            kyc_exists = await KYCVerification.objects.filter(
+                kyc_id=kyc_id, user=user
+            ).aexists()
+            if not kyc_exists:
+                raise NotFoundError("KYC verification not found")
+        return documents
+
     @staticmethod
     @aatomic
     async def verify_kyc_document(admin_user: User, document_id) -> KYCDocument:
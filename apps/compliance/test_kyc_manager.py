@@ -0,0 +1,117 @@
+"""
+Unit tests for KYC submission (apps/compliance/services/kyc_manager.py)
+
+Tests the submitted verification and how a repeated submission for the
+same level is reported.
+These are UNIT tests - testing business logic directly, not API endpoints.
+"""
+
+import pytest
+from datetime import date
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from apps.common.exceptions import RequestError, ErrorCode
+from apps.compliance.models import (
+    DocumentType,
+    KYCLevel,
+    KYCStatus,
+    KYCVerification,
+)
+from apps.compliance.schemas import CreateKYCSchema
+from apps.compliance.services.kyc_manager import KYCManager
+from apps.profiles.models import Country
+
+
+@pytest.fixture
+def in_memory_storage(settings):
+    """Keep uploaded documents off the real media storage."""
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "default": {"BACKEND": "django.core.files.storage.InMemoryStorage"},
+    }
+
+
+@pytest.fixture
+async def nigeria():
+    return await Country.objects.acreate(name="Nigeria", code="NG", currency="NGN")
+
+
+def kyc_data(country):
+    return CreateKYCSchema(
+        level=KYCLevel.TIER_1,
+        first_name="Verified",
+        last_name="User",
+        date_of_birth=date(1990, 1, 1),
+        nationality="NG",
+        address_line_1="1 Test Street",
+        city="Lagos",
+        state="Lagos",
+        postal_code="100001",
+        country_id=country.id,
+        document_type=DocumentType.NATIONAL_ID,
+        document_number="A12345678",
+        document_issuing_country_id=country.id,
+    )
+
+
+async def submit(user, country):
+    id_document = SimpleUploadedFile(
+        "id.jpg", b"id-document", content_type="image/jpeg"
+    )
+    return await KYCManager.submit_kyc(user, kyc_data(country), id_document, None)
+
+
+@pytest.mark.unit
+@pytest.mark.compliance
+@pytest.mark.usefixtures("in_memory_storage")
+class TestKYCSubmission:
+    """Test the verification returned by submit_kyc."""
+
+    @pytest.mark.django_db(transaction=True)
+    async def test_documents_loaded_for_response(self, verified_user, nigeria):
+        kyc = await submit(verified_user, nigeria)
+
+        documents = kyc.documents.all()  # served from the prefetch, no query
+        assert [d.document_type for d in documents] == [DocumentType.NATIONAL_ID]
+        assert documents[0].file_name == "id.jpg"
+
+
+@pytest.mark.unit
+@pytest.mark.compliance
+@pytest.mark.usefixtures("in_memory_storage")
+class TestDuplicateKYCSubmission:
+    """Test the unique (user, level) constraint surfaced as request errors."""
+
+    @pytest.mark.django_db(transaction=True)
+    async def test_second_submission_while_pending(self, verified_user, nigeria):
+        await submit(verified_user, nigeria)
+
+        with pytest.raises(RequestError) as exc_info:
+            await submit(verified_user, nigeria)
+
+        assert exc_info.value.err_code == ErrorCode.KYC_PENDING
+        assert await KYCVerification.objects.filter(user=verified_user).acount() == 1
+
+    @pytest.mark.django_db(transaction=True)
+    async def test_second_submission_after_approval(self, verified_user, nigeria):
+        kyc = await submit(verified_user, nigeria)
+        kyc.status = KYCStatus.APPROVED
+        await kyc.asave(update_fields=["status"])
+
+        with pytest.raises(RequestError) as exc_info:
+            await submit(verified_user, nigeria)
+
+        assert exc_info.value.err_code == ErrorCode.KYC_ALREADY_VERIFIED
+
+    @pytest.mark.django_db(transaction=True)
+    async def test_resubmission_after_rejection(self, verified_user, nigeria):
+        """A rejected verification no longer blocks the level."""
+        kyc = await submit(verified_user, nigeria)
+        kyc.status = KYCStatus.REJECTED
+        await kyc.asave(update_fields=["status"])
+
+        resubmitted = await submit(verified_user, nigeria)
+
+        assert resubmitted.id != kyc.id
+        assert resubmitted.status == KYCStatus.PENDING
+        assert await KYCVerification.objects.filter(user=verified_user).acount() == 2
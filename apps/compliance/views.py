@@ -1,6 +1,6 @@
 from ninja import Router, Query, File, Form
 from ninja.files import UploadedFile
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 import logging
 
@@ -15,6 +15,8 @@ logger = logging.getLogger(__name__)
 from apps.compliance.schemas import (
     CreateKYCSchema,
     KYCLevelSchema,
+    UploadKYCDocumentsSchema,
+    KYCDocumentListDataResponseSchema,
     # KYCVerificationsResponseSchema,
     # UpdateKYCStatusSchema,
     KYCVerificationDataResponseSchema,
@@ -43,7 +45,7 @@ from apps.compliance.services.kyc_manager import KYCManager
 # from apps.compliance.tasks import KYCWebhookTasks
 # import json
 
-compliance_router = Router(tags=["Compliance (4)"])
+compliance_router = Router(tags=["Compliance (5)"])
 
 
 # ==================== KYC ENDPOINTS ====================
@@ -76,6 +78,26 @@ async def submit_kyc(
     return CustomResponse.success("KYC verification submitted successfully", kyc, 201)
 
 
+@compliance_router.post(
+    "/kyc/{kyc_id}/documents",
+    summary="Upload KYC documents",
+    description="Upload several documents to a pending KYC verification in one request. Send one document type per file, in the same order.",
+    response={201: KYCDocumentListDataResponseSchema},
+    auth=AuthUser(),
+)
+async def upload_kyc_documents(
+    request,
+    kyc_id: UUID,
+    data: Form[UploadKYCDocumentsSchema],
+    files: List[UploadedFile] = File(...),
+):
+    user = request.auth
+    documents = await KYCManager.upload_kyc_documents_bulk(
+        user, kyc_id, data.document_types, files
+    )
+    return CustomResponse.success("KYC documents uploaded successfully", documents, 201)
+
+
 @compliance_router.get(
     "/kyc/my-verifications",
     summary="Get my KYC verifications",
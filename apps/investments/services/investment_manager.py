@@ -3,10 +3,11 @@ Investment manager service for creating and managing investments
 """
 
 from decimal import Decimal
+from django.db import transaction as db_transaction
 from django.utils import timezone
 from datetime import timedelta
 from typing import Optional
-import secrets
+import functools, secrets
 
 from apps.accounts.models import User
 from apps.common.decorators import aatomic
@@ -159,8 +160,12 @@ class InvestmentManager:
         if product.payout_frequency != InterestPayoutFrequency.AT_MATURITY:
             await InvestmentManager._generate_payout_schedule(investment, product)
 
-        # Send investment creation notification (in-app, push, email)
-        await sync_to_async(UnifiedNotificationDispatcher.dispatch)(
+        # Send investment creation notification (in-app, push, email) once
+        # the investment commits: the email is a Celery task that re-reads
+        # the investment, so enqueueing it inside the transaction can race
+        # the worker, and the in-app/push writes don't hold the transaction open
+        notify = functools.partial(
+            UnifiedNotificationDispatcher.dispatch,
             user=user,
             event_type=NotificationEventType.INVESTMENT_CREATED,
             channels=[
@@ -176,6 +181,7 @@ class InvestmentManager:
             related_object_id=str(investment.investment_id),
             action_url=f"/investments/{investment.investment_id}",
         )
+        await sync_to_async(db_transaction.on_commit)(notify)
 
         return investment
 
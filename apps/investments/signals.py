@@ -0,0 +1,18 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from apps.common.cache import CacheManager
+from apps.investments.models import InvestmentProduct
+
+
+@receiver(post_save, sender=InvestmentProduct)
+@receiver(post_delete, sender=InvestmentProduct)
+def invalidate_investment_product_list_cache(sender, instance, **kwargs):
+    """
+    Drop every cached product listing (all filter combinations) once the
+    change commits, so a concurrent read cannot re-cache the old slots_taken
+    """
+    transaction.on_commit(
+        lambda: CacheManager.delete_pattern("paycore:investments:products:list*")
+    )
@@ -148,7 +148,7 @@ class InvestmentTasks:
             raise self.retry(exc=exc)
 
     @staticmethod
-    @shared_task(name="investments.update_portfolios", queue="maintenance")
+    @shared_task(name="investments.update_portfolios", queue="maintenance_transient")
     def update_portfolios():
         """
         Update all user investment portfolios
@@ -3,6 +3,7 @@ from ninja import Router, Query
 from typing import Optional
 from uuid import UUID
 
+from apps.common.cache import cacheable
 from apps.common.responses import CustomResponse
 from apps.common.schemas import PaginationQuerySchema
 from apps.investments.schemas import (
@@ -26,7 +27,6 @@ from apps.investments.models import (
     InvestmentType,
     RiskLevel,
 )
-from asgiref.sync import sync_to_async
 
 investment_router = Router(tags=["Investments (10)"])
 
@@ -39,14 +39,35 @@ investment_router = Router(tags=["Investments (10)"])
     summary="List investment products",
     response={200: InvestmentProductListDataResponseSchema},
 )
+@cacheable(key="investments:products:list", ttl=300)
 async def list_investment_products(
     request,
     product_type: Optional[InvestmentType] = None,
     risk_level: Optional[RiskLevel] = None,
     currency_code: Optional[str] = None,
 ):
-    queryset = InvestmentProduct.objects.filter(is_active=True).select_related(
-        "currency"
+    # Only load the columns InvestmentProductListSchema renders
+    queryset = (
+        InvestmentProduct.objects.filter(is_active=True)
+        .select_related("currency")
+        .only(
+            "product_id",
+            "name",
+            "product_type",
+            "min_amount",
+            "max_amount",
+            "interest_rate",
+            "risk_level",
+            "min_duration_days",
+            "is_active",
+            "available_slots",
+            "slots_taken",
+            "currency__code",
+            "currency__name",
+            "currency__symbol",
+            "currency__decimal_places",
+            "currency__is_crypto",
+        )
     )
     if product_type:
         queryset = queryset.filter(product_type=product_type)
@@ -54,7 +75,7 @@ async def list_investment_products(
         queryset = queryset.filter(risk_level=risk_level)
     if currency_code:
         queryset = queryset.filter(currency__code=currency_code)
-    products = await sync_to_async(list)(queryset.order_by("product_type", "name"))
+    products = [product async for product in queryset.order_by("product_type", "name")]
     return CustomResponse.success(
         "Investment products retrieved successfully", products
     )
@@ -1,4 +1,6 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
+from apps.common.paginators import FastCountPaginator
 from apps.loans.models import (
     AutoRepayment,
     LoanProduct,
@@ -9,6 +11,26 @@ from apps.loans.models import (
 )
 
 
+class DeferredFieldsChangeList(ChangeList):
+    """Changelist that skips the admin's `changelist_defer` columns"""
+
+    def get_queryset(self, request, exclude_parameters=None):
+        queryset = super().get_queryset(request, exclude_parameters)
+        return queryset.defer(*self.model_admin.changelist_defer)
+
+
+class DeferredFieldsAdminMixin:
+    """
+    Keep wide JSON/text columns out of the changelist SELECT. The change
+    view still loads them, since only the changelist queryset is deferred.
+    """
+
+    changelist_defer = ()
+
+    def get_changelist(self, request, **kwargs):
+        return DeferredFieldsChangeList
+
+
 @admin.register(LoanProduct)
 class LoanProductAdmin(admin.ModelAdmin):
     list_display = [
@@ -79,11 +101,11 @@ class LoanProductAdmin(admin.ModelAdmin):
 
 
 @admin.register(LoanApplication)
-class LoanApplicationAdmin(admin.ModelAdmin):
+class LoanApplicationAdmin(DeferredFieldsAdminMixin, admin.ModelAdmin):
     list_display = [
         "application_id",
         "user",
-        "loan_product",
+        "loan_product_name",
         "requested_amount",
         "approved_amount",
         "status",
@@ -94,20 +116,20 @@ class LoanApplicationAdmin(admin.ModelAdmin):
     ]
     list_filter = [
         "status",
-        "loan_product__product_type",
+        "loan_product_type",
         "collateral_type",
         "credit_score_band",
         "repayment_frequency",
         "created_at",
         "disbursed_at",
     ]
+    # Every lookup here is backed by an index on the expression Django emits
     search_fields = [
-        "user__email",
-        "user__first_name",
-        "user__last_name",
+        "application_id__exact",
+        "^user__email",
+        "^guarantor_email",
         "purpose",
         "guarantor_name",
-        "guarantor_email",
     ]
     readonly_fields = [
         "application_id",
@@ -119,13 +141,18 @@ class LoanApplicationAdmin(admin.ModelAdmin):
         "reviewed_at",
         "disbursed_at",
     ]
-    raw_id_fields = [
-        "user",
-        "loan_product",
-        "wallet",
-        "reviewed_by",
-        "disbursement_transaction",
-    ]
+    autocomplete_fields = ["user", "loan_product", "wallet", "reviewed_by"]
+    raw_id_fields = ["disbursement_transaction"]
+    list_select_related = ("user", "wallet", "wallet__currency", "reviewed_by")
+    paginator = FastCountPaginator
+    show_full_result_count = False
+    changelist_defer = (
+        "purpose_details",
+        "collateral_description",
+        "risk_assessment",
+        "rejection_reason",
+        "metadata",
+    )
 
     fieldsets = (
         (
@@ -193,15 +220,6 @@ class LoanApplicationAdmin(admin.ModelAdmin):
         ("Metadata", {"fields": ("metadata", "created_at", "updated_at")}),
     )
 
-    def get_queryset(self, request):
-        return (
-            super()
-            .get_queryset(request)
-            .select_related(
-                "user", "loan_product", "wallet", "wallet__currency", "reviewed_by"
-            )
-        )
-
 
 @admin.register(LoanRepaymentSchedule)
 class LoanRepaymentScheduleAdmin(admin.ModelAdmin):
@@ -224,7 +242,10 @@ class LoanRepaymentScheduleAdmin(admin.ModelAdmin):
         "loan__application_id",
     ]
     readonly_fields = ["schedule_id", "created_at", "updated_at", "paid_at"]
-    raw_id_fields = ["loan"]
+    autocomplete_fields = ["loan"]
+    list_select_related = ("loan", "loan__user")
+    paginator = FastCountPaginator
+    show_full_result_count = False
 
     fieldsets = (
         (
@@ -248,12 +269,9 @@ class LoanRepaymentScheduleAdmin(admin.ModelAdmin):
         ("Metadata", {"fields": ("created_at", "updated_at")}),
     )
 
-    def get_queryset(self, request):
-        return super().get_queryset(request).select_related("loan", "loan__user")
-
 
 @admin.register(LoanRepayment)
-class LoanRepaymentAdmin(admin.ModelAdmin):
+class LoanRepaymentAdmin(DeferredFieldsAdminMixin, admin.ModelAdmin):
     list_display = [
         "repayment_id",
         "loan",
@@ -266,15 +284,18 @@ class LoanRepaymentAdmin(admin.ModelAdmin):
     ]
     list_filter = ["status", "is_early_repayment", "payment_method", "created_at"]
     search_fields = [
-        "reference",
-        "external_reference",
-        "loan__user__email",
-        "loan__user__first_name",
-        "loan__user__last_name",
-        "loan__application_id",
+        "reference__exact",
+        "external_reference__exact",
+        "^loan__user__email",
+        "loan__application_id__exact",
     ]
     readonly_fields = ["repayment_id", "reference", "created_at", "updated_at"]
-    raw_id_fields = ["loan", "schedule", "wallet", "transaction"]
+    autocomplete_fields = ["loan", "schedule", "wallet"]
+    raw_id_fields = ["transaction"]
+    list_select_related = ("loan", "loan__user", "wallet", "transaction", "schedule")
+    paginator = FastCountPaginator
+    show_full_result_count = False
+    changelist_defer = ("notes", "metadata")
 
     fieldsets = (
         (
@@ -299,16 +320,9 @@ class LoanRepaymentAdmin(admin.ModelAdmin):
         ("Metadata", {"fields": ("metadata", "created_at", "updated_at")}),
     )
 
-    def get_queryset(self, request):
-        return (
-            super()
-            .get_queryset(request)
-            .select_related("loan", "loan__user", "wallet", "transaction", "schedule")
-        )
-
 
 @admin.register(CreditScore)
-class CreditScoreAdmin(admin.ModelAdmin):
+class CreditScoreAdmin(DeferredFieldsAdminMixin, admin.ModelAdmin):
     list_display = [
         "score_id",
         "user",
@@ -339,7 +353,9 @@ class CreditScoreAdmin(admin.ModelAdmin):
         "created_at",
         "updated_at",
     ]
-    raw_id_fields = ["user"]
+    autocomplete_fields = ["user"]
+    list_select_related = ("user",)
+    changelist_defer = ("factors", "recommendations")
 
     fieldsets = (
         (
@@ -381,9 +397,6 @@ class CreditScoreAdmin(admin.ModelAdmin):
         ("Metadata", {"fields": ("created_at", "updated_at")}),
     )
 
-    def get_queryset(self, request):
-        return super().get_queryset(request).select_related("user")
-
 
 @admin.register(AutoRepayment)
 class AutoRepaymentAdmin(admin.ModelAdmin):
@@ -422,7 +435,8 @@ class AutoRepaymentAdmin(admin.ModelAdmin):
         "created_at",
         "updated_at",
     ]
-    raw_id_fields = ["loan", "wallet"]
+    autocomplete_fields = ["loan", "wallet"]
+    list_select_related = ("loan", "loan__user", "wallet", "wallet__currency")
 
     fieldsets = (
         (
@@ -488,10 +502,3 @@ class AutoRepaymentAdmin(admin.ModelAdmin):
         ),
         ("Metadata", {"fields": ("created_at", "updated_at")}),
     )
-
-    def get_queryset(self, request):
-        return (
-            super()
-            .get_queryset(request)
-            .select_related("loan", "loan__user", "wallet", "wallet__currency")
-        )
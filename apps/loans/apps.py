@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class LoansConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.loans"
+
+    def ready(self):
+        """Import signals when app is ready"""
+        import apps.loans.signals
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.6 on 2026-10-16 14:40
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("loans", "0003_alter_autorepayment_deleted_at_and_more"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="loanapplication",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["purpose"],
+                name="loan_app_purpose_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="loanapplication",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["guarantor_name"],
+                name="loan_app_guarantor_name_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="loanapplication",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["guarantor_email"],
+                name="loan_app_guarantor_email_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="loanrepayment",
+            index=models.Index(
+                fields=["external_reference"], name="loan_repayment_ext_ref_idx"
+            ),
+        ),
+    ]
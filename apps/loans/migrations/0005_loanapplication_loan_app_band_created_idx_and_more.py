@@ -0,0 +1,32 @@
+# Generated by Django 5.2.6 on 2026-10-16 15:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("loans", "0004_loanapplication_trigram_indexes_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="loanapplication",
+            index=models.Index(
+                fields=["credit_score_band", "-created_at"],
+                name="loan_app_band_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="loanrepaymentschedule",
+            index=models.Index(
+                fields=["status", "due_date"], name="loan_schedule_status_due_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="loanrepayment",
+            index=models.Index(
+                fields=["status", "-created_at"], name="loan_repayment_status_idx"
+            ),
+        ),
+    ]
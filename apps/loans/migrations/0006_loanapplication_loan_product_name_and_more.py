@@ -0,0 +1,46 @@
+# Generated by Django 5.2.6 on 2026-10-16 15:48
+
+from django.db import migrations, models
+
+
+def copy_product_fields(apps, schema_editor):
+    LoanApplication = apps.get_model("loans", "LoanApplication")
+    LoanProduct = apps.get_model("loans", "LoanProduct")
+    product_qs = LoanProduct.objects.filter(pk=models.OuterRef("loan_product_id"))
+    LoanApplication.objects.update(
+        loan_product_name=models.Subquery(product_qs.values("name")[:1]),
+        loan_product_type=models.Subquery(product_qs.values("product_type")[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("loans", "0005_loanapplication_loan_app_band_created_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="loanapplication",
+            name="loan_product_name",
+            field=models.CharField(blank=True, max_length=200),
+        ),
+        migrations.AddField(
+            model_name="loanapplication",
+            name="loan_product_type",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("personal", "Personal Loan"),
+                    ("business", "Business Loan"),
+                    ("payday", "Payday Loan"),
+                    ("emergency", "Emergency Loan"),
+                    ("education", "Education Loan"),
+                    ("auto", "Auto Loan"),
+                    ("home", "Home Loan"),
+                ],
+                max_length=20,
+            ),
+        ),
+        migrations.RunPython(copy_product_fields, migrations.RunPython.noop),
+    ]
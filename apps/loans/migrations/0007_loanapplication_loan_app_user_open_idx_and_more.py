@@ -0,0 +1,29 @@
+# Generated by Django 5.2.6 on 2026-10-16 16:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("loans", "0006_loanapplication_loan_product_name_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="loanapplication",
+            index=models.Index(
+                condition=models.Q(("status__in", ["active", "overdue"])),
+                fields=["user", "-created_at"],
+                name="loan_app_user_open_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="loanrepaymentschedule",
+            index=models.Index(
+                condition=models.Q(("status__in", ["pending", "partial", "overdue"])),
+                fields=["loan", "due_date"],
+                name="loan_schedule_unpaid_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-16 17:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("loans", "0007_loanapplication_loan_app_user_open_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="loanrepaymentschedule",
+            index=models.Index(
+                condition=models.Q(("status__in", ["pending", "partial", "overdue"])),
+                fields=["loan", "installment_number"],
+                name="loan_schedule_next_unpaid_idx",
+            ),
+        ),
+    ]
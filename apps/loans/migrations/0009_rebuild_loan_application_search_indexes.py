@@ -0,0 +1,67 @@
+# Generated by Django 5.2.6 on 2026-10-16 19:20
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.comparison
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("loans", "0008_loanrepaymentschedule_loan_schedule_next_unpaid_idx"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="loanapplication",
+            name="loan_app_purpose_trgm",
+        ),
+        migrations.RemoveIndex(
+            model_name="loanapplication",
+            name="loan_app_guarantor_name_trgm",
+        ),
+        migrations.RemoveIndex(
+            model_name="loanapplication",
+            name="loan_app_guarantor_email_trgm",
+        ),
+        migrations.AddIndex(
+            model_name="loanapplication",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("purpose"),
+                    name="gin_trgm_ops",
+                ),
+                name="loan_app_purpose_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="loanapplication",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("guarantor_name"),
+                    name="gin_trgm_ops",
+                ),
+                name="loan_app_guarantor_name_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="loanapplication",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("guarantor_email"),
+                    name="gin_trgm_ops",
+                ),
+                name="loan_app_guarantor_email_trgm",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="loanapplication",
+            index=models.Index(
+                django.db.models.functions.comparison.Cast(
+                    "application_id", output_field=models.CharField()
+                ),
+                name="loan_app_id_text_idx",
+            ),
+        ),
+    ]
@@ -1,4 +1,6 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Cast, Upper
 from django.utils import timezone
 import uuid
 
@@ -160,6 +162,12 @@ class LoanApplication(BaseModel):
     loan_product = models.ForeignKey(
         LoanProduct, on_delete=models.PROTECT, related_name="applications"
     )
+    # Copied from loan_product so list views don't need the join; kept in
+    # sync by the LoanProduct post_save signal
+    loan_product_name = models.CharField(max_length=200, blank=True)
+    loan_product_type = models.CharField(
+        max_length=20, choices=LoanProductType.choices, blank=True
+    )
 
     wallet = models.ForeignKey(
         "wallets.Wallet", on_delete=models.PROTECT, related_name="loan_applications"
@@ -242,11 +250,65 @@ class LoanApplication(BaseModel):
             models.Index(fields=["user", "-created_at"]),
             models.Index(fields=["status", "-created_at"]),
             models.Index(fields=["loan_product", "status"]),
+            models.Index(
+                fields=["credit_score_band", "-created_at"],
+                name="loan_app_band_created_idx",
+            ),
+            # Open loans are a small slice of the table; partial index keeps
+            # the per-user active/overdue lookups on a compact index
+            models.Index(
+                fields=["user", "-created_at"],
+                condition=models.Q(status__in=[LoanStatus.ACTIVE, LoanStatus.OVERDUE]),
+                name="loan_app_user_open_idx",
+            ),
+            # Admin search compiles to UPPER("col"::text) LIKE UPPER(...), so
+            # the trigram indexes are built on that expression
+            GinIndex(
+                OpClass(Upper("purpose"), name="gin_trgm_ops"),
+                name="loan_app_purpose_trgm",
+            ),
+            GinIndex(
+                OpClass(Upper("guarantor_name"), name="gin_trgm_ops"),
+                name="loan_app_guarantor_name_trgm",
+            ),
+            GinIndex(
+                OpClass(Upper("guarantor_email"), name="gin_trgm_ops"),
+                name="loan_app_guarantor_email_trgm",
+            ),
+            # application_id__exact in admin search compares the id as text
+            models.Index(
+                Cast("application_id", output_field=models.CharField()),
+                name="loan_app_id_text_idx",
+            ),
         ]
 
     def __str__(self):
         return f"Loan Application {self.application_id} - {self.user.email}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_loan_product_id = instance.__dict__.get("loan_product_id")
+        return instance
+
+    def save(self, *args, **kwargs):
+        """Snapshot the product display fields when the product is set or changed"""
+        product_changed = self.loan_product_id != getattr(
+            self, "_loaded_loan_product_id", None
+        )
+        if self.loan_product_id and (product_changed or not self.loan_product_name):
+            self.loan_product_name = self.loan_product.name
+            self.loan_product_type = self.loan_product.product_type
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None:
+                kwargs["update_fields"] = {
+                    *update_fields,
+                    "loan_product_name",
+                    "loan_product_type",
+                }
+        super().save(*args, **kwargs)
+        self._loaded_loan_product_id = self.loan_product_id
+
     @property
     def is_active(self):
         return self.status in [
@@ -261,16 +323,6 @@ class LoanApplication(BaseModel):
             return False
         return self.repayment_schedules.filter(status=RepaymentStatus.OVERDUE).exists()
 
-    @property
-    def loan_product_name(self):
-        """Get loan product name"""
-        return self.loan_product.name if self.loan_product else None
-
-    @property
-    def loan_product_type(self):
-        """Get loan product type"""
-        return self.loan_product.product_type if self.loan_product else None
-
 
 class LoanRepaymentSchedule(BaseModel):
     """Repayment schedule for each installment"""
@@ -308,6 +360,33 @@ class LoanRepaymentSchedule(BaseModel):
         indexes = [
             models.Index(fields=["loan", "status"]),
             models.Index(fields=["due_date", "status"]),
+            models.Index(
+                fields=["status", "due_date"], name="loan_schedule_status_due_idx"
+            ),
+            # Unpaid installments per loan (auto-repayment, overdue checks)
+            models.Index(
+                fields=["loan", "due_date"],
+                condition=models.Q(
+                    status__in=[
+                        RepaymentStatus.PENDING,
+                        RepaymentStatus.PARTIAL,
+                        RepaymentStatus.OVERDUE,
+                    ]
+                ),
+                name="loan_schedule_unpaid_idx",
+            ),
+            # Next unpaid installment of a loan (repayments, auto-repayment retries)
+            models.Index(
+                fields=["loan", "installment_number"],
+                condition=models.Q(
+                    status__in=[
+                        RepaymentStatus.PENDING,
+                        RepaymentStatus.PARTIAL,
+                        RepaymentStatus.OVERDUE,
+                    ]
+                ),
+                name="loan_schedule_next_unpaid_idx",
+            ),
         ]
         constraints = [
             models.UniqueConstraint(
@@ -382,7 +461,13 @@ class LoanRepayment(BaseModel):
         indexes = [
             models.Index(fields=["loan", "-created_at"]),
             models.Index(fields=["reference"]),
+            models.Index(
+                fields=["external_reference"], name="loan_repayment_ext_ref_idx"
+            ),
             models.Index(fields=["wallet", "-created_at"]),
+            models.Index(
+                fields=["status", "-created_at"], name="loan_repayment_status_idx"
+            ),
         ]
 
     def __str__(self):
@@ -570,6 +655,13 @@ class AutoRepayment(BaseModel):
     def is_active(self):
         return self.is_enabled and self.status == AutoRepaymentStatus.ACTIVE
 
+    def payment_amount(self, schedule):
+        """Amount to debit for a schedule: the amount due, capped by custom_amount"""
+        amount_due = schedule.outstanding_amount + schedule.late_fee
+        if not self.auto_pay_full_amount and self.custom_amount:
+            return min(self.custom_amount, amount_due)
+        return amount_due
+
     def suspend(self, reason: str = None):
         self.status = AutoRepaymentStatus.SUSPENDED
         if reason and self.metadata:
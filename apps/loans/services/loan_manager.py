@@ -45,14 +45,35 @@ class LoanManager:
     async def get_active_loan_products(
         currency_code: str = None, product_type: str = None
     ):
-        queryset = LoanProduct.objects.filter(is_active=True).select_related("currency")
+        # Only the columns LoanProductListSchema renders
+        queryset = (
+            LoanProduct.objects.filter(is_active=True)
+            .select_related("currency")
+            .only(
+                "product_id",
+                "name",
+                "product_type",
+                "min_amount",
+                "max_amount",
+                "min_interest_rate",
+                "max_interest_rate",
+                "min_tenure_months",
+                "max_tenure_months",
+                "is_active",
+                "currency__code",
+                "currency__name",
+                "currency__symbol",
+                "currency__decimal_places",
+                "currency__is_crypto",
+            )
+        )
         if currency_code:
             queryset = queryset.filter(currency__code=currency_code)
         if product_type:
             queryset = queryset.filter(product_type=product_type)
-        return await sync_to_async(list)(
-            queryset.order_by("product_type", "min_amount")
-        )
+        return [
+            product async for product in queryset.order_by("product_type", "min_amount")
+        ]
 
     @staticmethod
     async def get_loan_product(product_id) -> LoanProduct:
@@ -275,8 +296,29 @@ class LoanManager:
     async def list_loan_applications(
         user: User, status: str = None, page_params: PaginationQuerySchema = None
     ):
-        queryset = LoanApplication.objects.filter(user=user).select_related(
-            "loan_product", "wallet", "loan_product__currency"
+        # Only the columns LoanApplicationListSchema renders
+        queryset = (
+            LoanApplication.objects.filter(user=user)
+            .select_related("loan_product", "loan_product__currency")
+            .only(
+                "application_id",
+                "requested_amount",
+                "approved_amount",
+                "tenure_months",
+                "monthly_repayment",
+                "total_repayable",
+                "status",
+                "credit_score",
+                "disbursed_at",
+                "created_at",
+                "loan_product_name",
+                "loan_product_type",
+                "loan_product__currency__code",
+                "loan_product__currency__name",
+                "loan_product__currency__symbol",
+                "loan_product__currency__decimal_places",
+                "loan_product__currency__is_crypto",
+            )
         )
 
         if status:
@@ -426,31 +468,32 @@ class LoanManager:
         principal_per_installment = loan.approved_amount / num_installments
         interest_per_installment = loan.total_interest / num_installments
 
-        interval_days = LoanManager._get_payment_interval_days(loan.repayment_frequency)
+        # Resolve the frequency once; installment i falls due i steps out
+        if loan.repayment_frequency == RepaymentFrequency.MONTHLY:
+            step = relativedelta(months=1)
+        elif loan.repayment_frequency == RepaymentFrequency.QUARTERLY:
+            step = relativedelta(months=3)
+        else:
+            step = timedelta(
+                days=LoanManager._get_payment_interval_days(loan.repayment_frequency)
+            )
 
-        schedules = []
         current_date = timezone.now().date()
-
-        for i in range(1, int(num_installments) + 1):
-            if loan.repayment_frequency == RepaymentFrequency.MONTHLY:
-                due_date = current_date + relativedelta(months=i)
-            elif loan.repayment_frequency == RepaymentFrequency.QUARTERLY:
-                due_date = current_date + relativedelta(months=i * 3)
-            else:
-                due_date = current_date + timedelta(days=interval_days * i)
-
-            schedule = LoanRepaymentSchedule(
+        schedules = [
+            LoanRepaymentSchedule(
                 loan=loan,
                 installment_number=i,
-                due_date=due_date,
+                due_date=current_date + step * i,
                 principal_amount=principal_per_installment,
                 interest_amount=interest_per_installment,
                 total_amount=installment_amount,
                 outstanding_amount=installment_amount,
                 status=RepaymentStatus.PENDING,
             )
-            schedules.append(schedule)
-        await LoanRepaymentSchedule.objects.abulk_create(schedules)
+            for i in range(1, int(num_installments) + 1)
+        ]
+        # Daily schedules run to thousands of rows; keep each INSERT bounded
+        await LoanRepaymentSchedule.objects.abulk_create(schedules, batch_size=1000)
 
     @staticmethod
     def _get_payment_interval_days(frequency: str) -> int:
@@ -1,6 +1,6 @@
 from decimal import Decimal
 from django.utils import timezone
-from django.db.models import Sum, F, Case, When, DecimalField, Count, Min, Q
+from django.db.models import Sum, Count, Min, OuterRef, Prefetch, Q, Subquery
 from django.db.models.functions import Coalesce
 import secrets
 
@@ -37,6 +37,10 @@ from asgiref.sync import sync_to_async
 class LoanProcessor:
     """Service for processing loan disbursements and repayments"""
 
+    # Repayments embedded in the loan details response; the full history is
+    # paginated by get_loan_repayments
+    LOAN_DETAILS_RECENT_REPAYMENTS = 10
+
     @staticmethod
     @aatomic
     async def disburse_loan(application_id, admin_user: User = None) -> LoanApplication:
@@ -310,8 +314,17 @@ class LoanProcessor:
         if not loan:
             raise NotFoundError("Loan application not found")
         return await Paginator.paginate_queryset(
+            # LoanRepaymentListSchema renders no relations
             LoanRepayment.objects.filter(loan=loan)
-            .select_related("wallet", "transaction", "schedule")
+            .only(
+                "repayment_id",
+                "amount",
+                "principal_paid",
+                "interest_paid",
+                "reference",
+                "status",
+                "created_at",
+            )
             .order_by("-created_at"),
             page_params.page,
             page_params.limit,
@@ -323,21 +336,32 @@ class LoanProcessor:
             "wallet__currency"
         )
 
-        total_loans = await loans_q.acount()
-        active_loans = await loans_q.filter(status=LoanStatus.ACTIVE).acount()
-        completed_loans = await loans_q.filter(status=LoanStatus.PAID).acount()
-        rejected_loans = await loans_q.filter(status=LoanStatus.REJECTED).acount()
-
-        # Calculate financial metrics
-        total_borrowed_agg = await loans_q.filter(
-            status__in=[
-                LoanStatus.DISBURSED,
-                LoanStatus.ACTIVE,
-                LoanStatus.OVERDUE,
-                LoanStatus.PAID,
-            ]
-        ).aaggregate(total_borrowed=Coalesce(Sum("approved_amount"), Decimal("0")))
-        total_borrowed = total_borrowed_agg["total_borrowed"] or Decimal("0")
+        # Counts and total borrowed in one pass over the user's loans
+        loan_totals = await loans_q.aaggregate(
+            total_loans=Count("id"),
+            active_loans=Count("id", filter=Q(status=LoanStatus.ACTIVE)),
+            completed_loans=Count("id", filter=Q(status=LoanStatus.PAID)),
+            rejected_loans=Count("id", filter=Q(status=LoanStatus.REJECTED)),
+            total_borrowed=Coalesce(
+                Sum(
+                    "approved_amount",
+                    filter=Q(
+                        status__in=[
+                            LoanStatus.DISBURSED,
+                            LoanStatus.ACTIVE,
+                            LoanStatus.OVERDUE,
+                            LoanStatus.PAID,
+                        ]
+                    ),
+                ),
+                Decimal("0"),
+            ),
+        )
+        total_loans = loan_totals["total_loans"]
+        active_loans = loan_totals["active_loans"]
+        completed_loans = loan_totals["completed_loans"]
+        rejected_loans = loan_totals["rejected_loans"]
+        total_borrowed = loan_totals["total_borrowed"]
 
         # Get total repaid
         repayments_qs = LoanRepayment.objects.filter(loan__user=user)
@@ -355,71 +379,44 @@ class LoanProcessor:
         overdue_amount = Decimal("0")
         overdue_count = 0
 
-        active_loan_ids = await sync_to_async(list)(
-            loans_q.filter(status=LoanStatus.ACTIVE).values_list("id", flat=True)
-        )
-
-        if active_loan_ids:
+        if active_loans:
+            # Join to the loan instead of fetching the active loan ids first
             schedules_qs = LoanRepaymentSchedule.objects.filter(
-                loan_id__in=active_loan_ids
+                loan__user=user, loan__status=LoanStatus.ACTIVE
             )
+            unpaid_statuses = [
+                RepaymentStatus.PENDING,
+                RepaymentStatus.OVERDUE,
+                RepaymentStatus.PARTIAL,
+            ]
 
             # Get current date for overdue calculation
             today = timezone.now().date()
+            overdue = ~Q(status=RepaymentStatus.PAID) & Q(due_date__lt=today)
 
             aggregates = await schedules_qs.aaggregate(
                 outstanding_balance=Sum(
-                    Case(
-                        When(
-                            status__in=[
-                                RepaymentStatus.PENDING,
-                                RepaymentStatus.OVERDUE,
-                                RepaymentStatus.PARTIAL,
-                            ],
-                            then=F("outstanding_amount"),
-                        ),
-                        output_field=DecimalField(),
-                    )
-                ),
-                overdue_amount=Sum(
-                    Case(
-                        When(
-                            ~Q(status=RepaymentStatus.PAID),
-                            due_date__lt=today,
-                            then=F("outstanding_amount"),
-                        ),
-                        output_field=DecimalField(),
-                    )
-                ),
-                overdue_count=Count(
-                    Case(
-                        When(
-                            ~Q(status=RepaymentStatus.PAID), due_date__lt=today, then=1
-                        )
-                    )
+                    "outstanding_amount", filter=Q(status__in=unpaid_statuses)
                 ),
+                overdue_amount=Sum("outstanding_amount", filter=overdue),
+                overdue_count=Count("id", filter=overdue),
                 upcoming_payment_date=Min(
-                    Case(
-                        When(
-                            status__in=[
-                                RepaymentStatus.PENDING,
-                                RepaymentStatus.OVERDUE,
-                                RepaymentStatus.PARTIAL,
-                            ],
-                            then=F("due_date"),
-                        )
-                    )
+                    "due_date", filter=Q(status__in=unpaid_statuses)
                 ),
             )
 
             # Get upcoming payment amount for that date
             upcoming_payment_amount = Decimal("0")
             if aggregates["upcoming_payment_date"]:
-                next_schedule = await schedules_qs.filter(
-                    due_date=aggregates["upcoming_payment_date"]
-                ).afirst()
-                if next_schedule:
-                    upcoming_payment_amount = next_schedule.outstanding_amount
+                next_outstanding = (
+                    await schedules_qs.filter(
+                        due_date=aggregates["upcoming_payment_date"]
+                    )
+                    .values_list("outstanding_amount", flat=True)
+                    .afirst()
+                )
+                if next_outstanding is not None:
+                    upcoming_payment_amount = next_outstanding
 
             # Extract results safely
             outstanding_balance = aggregates["outstanding_balance"] or Decimal("0")
@@ -455,48 +452,80 @@ class LoanProcessor:
 
     @staticmethod
     async def get_loan_details(user: User, application_id) -> dict:
-        loan = await LoanApplication.objects.select_related(
-            "user", "loan_product", "wallet", "loan_product__currency", "reviewed_by"
-        ).aget_or_none(application_id=application_id, user=user)
+        # Schedules and the latest repayments are prefetched with the loan and
+        # the balances derived from them; total paid is summed in SQL since
+        # only a bounded slice of repayments is loaded
+        total_paid_subquery = (
+            LoanRepayment.objects.filter(loan=OuterRef("pk"))
+            .values("loan")
+            .annotate(total=Sum("amount"))
+            .values("total")
+        )
+        loan = (
+            await LoanApplication.objects.select_related(
+                "user",
+                "loan_product",
+                "wallet",
+                "loan_product__currency",
+                "reviewed_by",
+            )
+            .annotate(total_paid=Coalesce(Subquery(total_paid_subquery), Decimal("0")))
+            .prefetch_related(
+                Prefetch(
+                    "repayment_schedules",
+                    queryset=LoanRepaymentSchedule.objects.order_by(
+                        "installment_number"
+                    ),
+                ),
+                Prefetch(
+                    "repayments",
+                    queryset=LoanRepayment.objects.only(
+                        "loan_id",
+                        "repayment_id",
+                        "amount",
+                        "principal_paid",
+                        "interest_paid",
+                        "reference",
+                        "status",
+                        "created_at",
+                    ).order_by("-created_at")[
+                        : LoanProcessor.LOAN_DETAILS_RECENT_REPAYMENTS
+                    ],
+                ),
+            )
+            .aget_or_none(application_id=application_id, user=user)
+        )
 
         if not loan:
             raise NotFoundError("Loan application not found")
 
-        schedules_qs = LoanRepaymentSchedule.objects.filter(loan=loan).order_by(
-            "installment_number"
-        )
-
-        repayments_qs = (
-            LoanRepayment.objects.filter(loan=loan)
-            .select_related("wallet", "transaction")
-            .order_by("-created_at")
-        )
+        schedules = list(loan.repayment_schedules.all())
+        repayments = list(loan.repayments.all())
 
         # Calculate totals
-        total_paid = (
-            await repayments_qs.aaggregate(
-                total_paid=Coalesce(Sum("amount"), Decimal("0"))
-            )
-        )["total_paid"]
-        remaining_balance = (
-            await schedules_qs.filter(
-                status__in=[
+        total_paid = loan.total_paid
+        remaining_balance = sum(
+            (
+                schedule.outstanding_amount
+                for schedule in schedules
+                if schedule.status
+                in (
                     RepaymentStatus.PENDING,
                     RepaymentStatus.OVERDUE,
                     RepaymentStatus.PARTIAL,
-                ]
-            ).aaggregate(
-                remaining_balance=Coalesce(Sum("outstanding_amount"), Decimal("0"))
-            )
-        )["remaining_balance"]
+                )
+            ),
+            Decimal("0"),
+        )
 
-        # Get next due payment
-        next_schedule = (
-            await LoanRepaymentSchedule.objects.filter(
-                loan=loan, status__in=[RepaymentStatus.PENDING, RepaymentStatus.OVERDUE]
-            )
-            .order_by("installment_number")
-            .afirst()
+        # Get next due payment (schedules are in installment order)
+        next_schedule = next(
+            (
+                schedule
+                for schedule in schedules
+                if schedule.status in (RepaymentStatus.PENDING, RepaymentStatus.OVERDUE)
+            ),
+            None,
         )
 
         next_due_date = next_schedule.due_date if next_schedule else None
@@ -506,8 +535,8 @@ class LoanProcessor:
 
         return {
             "application": loan,
-            "repayment_schedule": await sync_to_async(list)(schedules_qs),
-            "repayments": await sync_to_async(list)(repayments_qs),
+            "repayment_schedule": schedules,
+            "repayments": repayments,
             "total_paid": total_paid,
             "remaining_balance": remaining_balance,
             "next_due_date": next_due_date,
@@ -0,0 +1,30 @@
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from apps.common.cache import CacheManager
+from apps.loans.models import LoanApplication, LoanProduct
+
+
+@receiver(post_save, sender=LoanProduct)
+def sync_loan_application_product_fields(sender, instance, created, **kwargs):
+    """Keep the product name/type copied onto applications up to date"""
+    if created:
+        return
+    LoanApplication.objects.filter(loan_product=instance).filter(
+        ~Q(loan_product_name=instance.name)
+        | ~Q(loan_product_type=instance.product_type)
+    ).update(loan_product_name=instance.name, loan_product_type=instance.product_type)
+
+
+@receiver(post_save, sender=LoanProduct)
+@receiver(post_delete, sender=LoanProduct)
+def invalidate_loan_product_list_cache(sender, instance, **kwargs):
+    """
+    Drop every cached product listing (all filter combinations) once the
+    change commits, so a concurrent read cannot re-cache the old row
+    """
+    transaction.on_commit(
+        lambda: CacheManager.delete_pattern("paycore:loans:products:list*")
+    )
@@ -2,11 +2,31 @@ import logging
 from celery import shared_task
 from django.utils import timezone
 from django.db import transaction as db_transaction
+from django.db.models import (
+    Case,
+    Count,
+    DateField,
+    Exists,
+    ExpressionWrapper,
+    F,
+    OuterRef,
+    Prefetch,
+    Subquery,
+    Value,
+    When,
+    prefetch_related_objects,
+)
+from django.contrib.postgres.functions import TransactionNow
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Now
+from collections import defaultdict
 from datetime import timedelta
+from decimal import Decimal
 from asgiref.sync import async_to_sync
 from django.conf import settings
 from apps.loans.models import (
     AutoRepayment,
+    LoanProduct,
     LoanRepaymentSchedule,
     RepaymentStatus,
     AutoRepaymentStatus,
@@ -20,6 +40,8 @@ from apps.accounts.models import User
 from apps.loans.emails import LoanEmailUtil
 from apps.loans.models import LoanApplication
 from apps.loans.models import LoanRepayment
+from apps.notifications.models import NotificationPriority, NotificationType
+from apps.notifications.services.base import NotificationService
 
 logger = logging.getLogger(__name__)
 
@@ -183,18 +205,70 @@ class LoanApprovalTasks:
 class AutoRepaymentTasks:
     """Automatic loan repayment tasks"""
 
+    # Users with more due auto-repayments than this are processed on the
+    # loans_large queue so one long batch cannot hold up the loans queue
+    LARGE_SHARD_THRESHOLD = 100
+    AUTO_REPAYMENT_CHUNK_SIZE = 500
+
+    @staticmethod
+    def _due_auto_repayments(today):
+        """Active auto-repayments with an installment inside their trigger window"""
+        due_schedules = LoanRepaymentSchedule.objects.filter(
+            loan=OuterRef("loan"),
+            status__in=[RepaymentStatus.PENDING, RepaymentStatus.OVERDUE],
+            # date + integer is a date in Postgres
+            due_date__lte=ExpressionWrapper(
+                Value(today) + OuterRef("days_before_due"), output_field=DateField()
+            ),
+        )
+        return AutoRepayment.objects.filter(
+            Exists(due_schedules),
+            is_enabled=True,
+            status=AutoRepaymentStatus.ACTIVE,
+            loan__status__in=[LoanStatus.ACTIVE, LoanStatus.OVERDUE],
+        )
+
+    @staticmethod
+    @shared_task(name="loans.process_auto_repayments", queue="loans")
+    def process_auto_repayments():
+        """
+        Fan out the daily auto-repayment run into one task per user
+        Runs daily; each user's batch is routed by its size
+        """
+
+        shards = (
+            AutoRepaymentTasks._due_auto_repayments(timezone.now().date())
+            .values("loan__user_id")
+            .annotate(count=Count("id"))
+            .order_by()
+        )
+
+        dispatched = 0
+        for shard in shards.iterator():
+            queue = (
+                "loans_large"
+                if shard["count"] > AutoRepaymentTasks.LARGE_SHARD_THRESHOLD
+                else "loans"
+            )
+            AutoRepaymentTasks.process_user_auto_repayments.apply_async(
+                args=[str(shard["loan__user_id"])], queue=queue
+            )
+            dispatched += 1
+
+        logger.info(f"Auto-repayment run dispatched for {dispatched} users")
+        return {"status": "success", "dispatched": dispatched}
+
     @staticmethod
     @shared_task(
         bind=True,
         autoretry_for=(Exception,),
         retry_kwargs={"max_retries": 2, "countdown": 300},
-        name="loans.process_auto_repayments",
+        name="loans.process_user_auto_repayments",
         queue="loans",
     )
-    def process_auto_repayments(self):
+    def process_user_auto_repayments(self, user_id: str):
         """
-        Process automatic loan repayments for due schedules
-        Runs daily to check for upcoming/due repayments
+        Process automatic loan repayments for a user's due schedules
         """
 
         try:
@@ -202,111 +276,173 @@ class AutoRepaymentTasks:
             processed_count = 0
             failed_count = 0
 
-            # Get all active auto-repayment configurations
-            auto_repayments = (
-                AutoRepayment.objects.filter(
-                    is_enabled=True,
-                    status=AutoRepaymentStatus.ACTIVE,
-                    loan__status__in=[LoanStatus.ACTIVE, LoanStatus.OVERDUE],
-                )
+            # Get the user's auto-repayments that have something due
+            user_auto_repayments = (
+                AutoRepaymentTasks._due_auto_repayments(today)
+                .filter(loan__user_id=user_id)
                 .select_related("loan", "loan__user", "wallet", "wallet__currency")
-                .all()
+                .order_by("id")
             )
 
-            for auto_repay in auto_repayments:
-                try:
-                    # Calculate trigger date (due_date - days_before_due)
-                    trigger_date = today + timedelta(days=auto_repay.days_before_due)
-
-                    # Get next pending/overdue schedule due on or before trigger date
-                    next_schedule = (
-                        LoanRepaymentSchedule.objects.filter(
-                            loan=auto_repay.loan,
-                            status__in=[
-                                RepaymentStatus.PENDING,
-                                RepaymentStatus.OVERDUE,
-                            ],
-                            due_date__lte=trigger_date,
-                        )
-                        .order_by("installment_number")
-                        .first()
+            # Work through the rows in chunks, each in its own transaction
+            # with the rows locked, so a concurrent retry skips rows this
+            # batch holds and a failed chunk rolls back as a unit
+            success_notifications = []
+            last_id = None
+            while True:
+                with db_transaction.atomic():
+                    chunk = user_auto_repayments
+                    if last_id is not None:
+                        chunk = chunk.filter(id__gt=last_id)
+                    auto_repayments = list(
+                        chunk.select_for_update(skip_locked=True, of=("self",))[
+                            : AutoRepaymentTasks.AUTO_REPAYMENT_CHUNK_SIZE
+                        ]
+                    )
+                    if not auto_repayments:
+                        break
+                    last_id = auto_repayments[-1].id
+
+                    # Load every candidate schedule for the batch in one query rather
+                    # than one query per auto-repayment; the window covers the
+                    # largest days_before_due, narrowed per loan below
+                    max_days_before_due = max(
+                        (auto_repay.days_before_due for auto_repay in auto_repayments),
+                        default=0,
+                    )
+                    prefetch_related_objects(
+                        auto_repayments,
+                        Prefetch(
+                            "loan__repayment_schedules",
+                            queryset=LoanRepaymentSchedule.objects.filter(
+                                status__in=[
+                                    RepaymentStatus.PENDING,
+                                    RepaymentStatus.OVERDUE,
+                                ],
+                                due_date__lte=today
+                                + timedelta(days=max_days_before_due),
+                            ).order_by("installment_number"),
+                            to_attr="due_schedules",
+                        ),
                     )
 
-                    if not next_schedule:
-                        continue  # No pending payments due on or before trigger date
-
-                    # Determine payment amount
-                    if auto_repay.auto_pay_full_amount:
-                        amount = (
-                            next_schedule.outstanding_amount + next_schedule.late_fee
-                        )
-                    elif auto_repay.custom_amount:
-                        amount = min(
-                            auto_repay.custom_amount,
-                            next_schedule.outstanding_amount + next_schedule.late_fee,
-                        )
-                    else:
-                        amount = (
-                            next_schedule.outstanding_amount + next_schedule.late_fee
+                    # Work out what each row owes; the payments themselves
+                    # run together below
+                    payments = []
+                    for auto_repay in auto_repayments:
+                        try:
+                            # Calculate trigger date (due_date - days_before_due)
+                            trigger_date = today + timedelta(
+                                days=auto_repay.days_before_due
+                            )
+
+                            # Get next pending/overdue schedule due on or before trigger date
+                            next_schedule = next(
+                                (
+                                    schedule
+                                    for schedule in auto_repay.loan.due_schedules
+                                    if schedule.due_date <= trigger_date
+                                ),
+                                None,
+                            )
+
+                            if not next_schedule:
+                                continue  # No pending payments due on or before trigger date
+
+                            # Determine payment amount
+                            amount = auto_repay.payment_amount(next_schedule)
+
+                            # Check wallet balance
+                            if auto_repay.wallet.balance < amount:
+                                AutoRepaymentTasks._handle_payment_failure(
+                                    auto_repay,
+                                    f"Insufficient balance. Required: {amount}, Available: {auto_repay.wallet.balance}",
+                                )
+                                failed_count += 1
+                                continue
+
+                            payment_data = MakeLoanRepaymentSchema(
+                                wallet_id=auto_repay.wallet.wallet_id,
+                                amount=amount,
+                                schedule_id=next_schedule.schedule_id,
+                                notes=f"Automatic repayment for installment #{next_schedule.installment_number}",
+                            )
+                            payments.append((auto_repay, amount, payment_data))
+
+                        except Exception as e:
+                            logger.error(
+                                f"Auto-repayment failed for loan {auto_repay.loan.application_id}: {str(e)}"
+                            )
+                            AutoRepaymentTasks._handle_payment_failure(
+                                auto_repay, str(e)
+                            )
+                            failed_count += 1
+
+                    # Process the chunk's repayments on a single event loop
+                    # rather than spinning one up per payment
+                    outcomes = (
+                        async_to_sync(AutoRepaymentTasks._make_repayments)(
+                            [
+                                (
+                                    auto_repay.loan.user,
+                                    auto_repay.loan.application_id,
+                                    payment_data,
+                                )
+                                for auto_repay, _, payment_data in payments
+                            ]
                         )
+                        if payments
+                        else []
+                    )
 
-                    # Check wallet balance
-                    if auto_repay.wallet.balance < amount:
-                        AutoRepaymentTasks._handle_payment_failure(
-                            auto_repay,
-                            f"Insufficient balance. Required: {amount}, Available: {auto_repay.wallet.balance}",
-                            retry_task=self if auto_repay.retry_on_failure else None,
+                    succeeded = []
+                    for (auto_repay, amount, _), outcome in zip(payments, outcomes):
+                        if isinstance(outcome, Exception):
+                            logger.error(
+                                f"Auto-repayment failed for loan {auto_repay.loan.application_id}: {str(outcome)}"
+                            )
+                            AutoRepaymentTasks._handle_payment_failure(
+                                auto_repay, str(outcome)
+                            )
+                            failed_count += 1
+                            continue
+
+                        # Tracking fields are written for the whole batch below
+                        now = timezone.now()
+                        auto_repay.total_payments_made += 1
+                        auto_repay.last_payment_date = now
+                        auto_repay.last_payment_amount = amount
+                        auto_repay.consecutive_failures = 0  # Reset failure counter
+                        auto_repay.updated_at = now
+                        succeeded.append(auto_repay)
+
+                        processed_count += 1
+                        logger.info(
+                            f"Auto-repayment successful: Loan {auto_repay.loan.application_id}, Amount: {amount}"
                         )
-                        failed_count += 1
-                        continue
-
-                    # Process payment
-                    user = auto_repay.loan.user
-                    payment_data = MakeLoanRepaymentSchema(
-                        wallet_id=auto_repay.wallet.wallet_id,
-                        amount=amount,
-                        schedule_id=next_schedule.schedule_id,
-                        notes=f"Automatic repayment for installment #{next_schedule.installment_number}",
-                    )
 
-                    # Process repayment using async_to_sync
-                    repayment = async_to_sync(LoanProcessor.make_repayment)(
-                        user, auto_repay.loan.application_id, payment_data
-                    )
+                        if auto_repay.send_notification_on_success:
+                            success_notifications.append((str(auto_repay.id), amount))
 
-                    auto_repay.total_payments_made += 1
-                    auto_repay.last_payment_date = timezone.now()
-                    auto_repay.last_payment_amount = amount
-                    auto_repay.consecutive_failures = 0  # Reset failure counter
-                    auto_repay.save(
-                        update_fields=[
+                    AutoRepayment.objects.bulk_update(
+                        succeeded,
+                        [
                             "total_payments_made",
                             "last_payment_date",
                             "last_payment_amount",
                             "consecutive_failures",
                             "updated_at",
-                        ]
-                    )
-
-                    processed_count += 1
-                    logger.info(
-                        f"Auto-repayment successful: Loan {auto_repay.loan.application_id}, Amount: {amount}"
-                    )
-
-                    if auto_repay.send_notification_on_success:
-                        AutoRepaymentTasks.send_auto_repayment_notification.delay(
-                            auto_repay.id, "success", amount
-                        )
-
-                except Exception as e:
-                    logger.error(
-                        f"Auto-repayment failed for loan {auto_repay.loan.application_id}: {str(e)}"
+                        ],
+                        batch_size=1000,
                     )
-                    AutoRepaymentTasks._handle_payment_failure(auto_repay, str(e))
-                    failed_count += 1
+            # Notify once the tracking fields the notification reads are saved
+            if success_notifications:
+                AutoRepaymentTasks.send_auto_repayment_notifications_bulk.delay(
+                    success_notifications, "success"
+                )
 
             logger.info(
-                f"Auto-repayment batch complete: {processed_count} succeeded, {failed_count} failed"
+                f"Auto-repayment batch complete for user {user_id}: {processed_count} succeeded, {failed_count} failed"
             )
             return {
                 "status": "success",
@@ -315,11 +451,27 @@ class AutoRepaymentTasks:
             }
 
         except Exception as exc:
-            logger.error(f"Auto-repayment batch failed: {str(exc)}")
+            logger.error(f"Auto-repayment batch failed for user {user_id}: {str(exc)}")
             raise self.retry(exc=exc)
 
     @staticmethod
-    def _handle_payment_failure(auto_repay, reason: str, retry_task=None):
+    async def _make_repayments(payments: list) -> list:
+        """Make repayments in order, returning each repayment or the error it raised"""
+        outcomes = []
+        for user, application_id, payment_data in payments:
+            try:
+                # make_repayment is atomic, so a failure only rolls back its own savepoint
+                outcomes.append(
+                    await LoanProcessor.make_repayment(
+                        user, application_id, payment_data
+                    )
+                )
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
+
+    @staticmethod
+    def _handle_payment_failure(auto_repay, reason: str):
         """Handle failed automatic payment"""
         auto_repay.last_failure_date = timezone.now()
         auto_repay.last_failure_reason = reason
@@ -350,17 +502,33 @@ class AutoRepaymentTasks:
                 auto_repay.id, "failure", reason=reason
             )
 
-        if (
-            retry_task
-            and auto_repay.retry_on_failure
-            and auto_repay.consecutive_failures < auto_repay.max_retry_attempts
-        ):
-            retry_countdown = (
-                auto_repay.retry_interval_hours * 3600
-            )  # Convert to seconds
-            AutoRepaymentTasks.retry_failed_auto_repayment.apply_async(
-                args=[auto_repay.id], countdown=retry_countdown
-            )
+    @staticmethod
+    @shared_task(name="loans.retry_due_auto_repayments", queue="loans")
+    def retry_due_auto_repayments():
+        """
+        Queue retries for auto-repayments whose retry interval has elapsed
+        Runs hourly; retries are due once retry_interval_hours have passed
+        since the last insufficient-balance failure
+        """
+
+        due_ids = AutoRepayment.objects.filter(
+            is_enabled=True,
+            status=AutoRepaymentStatus.ACTIVE,
+            retry_on_failure=True,
+            consecutive_failures__gt=0,
+            consecutive_failures__lt=F("max_retry_attempts"),
+            last_failure_reason__startswith="Insufficient balance",
+            last_failure_date__lte=Now()
+            - F("retry_interval_hours") * Value(timedelta(hours=1)),
+        ).values_list("id", flat=True)
+
+        queued = 0
+        for auto_repayment_id in due_ids.iterator():
+            AutoRepaymentTasks.retry_failed_auto_repayment.delay(str(auto_repayment_id))
+            queued += 1
+
+        logger.info(f"Queued {queued} auto-repayment retries")
+        return {"status": "success", "queued": queued}
 
     @staticmethod
     @shared_task(name="loans.retry_failed_auto_repayment", queue="loans")
@@ -368,79 +536,80 @@ class AutoRepaymentTasks:
         """Retry a failed automatic repayment"""
 
         try:
-            auto_repay = AutoRepayment.objects.select_related(
-                "loan", "loan__user", "wallet", "wallet__currency"
-            ).get(id=auto_repayment_id)
-
-            next_schedule = (
-                LoanRepaymentSchedule.objects.filter(
-                    loan=auto_repay.loan,
-                    status__in=[RepaymentStatus.PENDING, RepaymentStatus.OVERDUE],
-                )
-                .order_by("installment_number")
-                .first()
-            )
-
-            if not next_schedule:
-                logger.info(
-                    f"No pending schedule for retry: {auto_repay.loan.application_id}"
+            with db_transaction.atomic():
+                auto_repay = (
+                    AutoRepayment.objects.select_related(
+                        "loan", "loan__user", "wallet", "wallet__currency"
+                    )
+                    .select_for_update(skip_locked=True, of=("self",))
+                    .filter(id=auto_repayment_id, consecutive_failures__gt=0)
+                    .first()
                 )
-                return {"status": "skipped", "reason": "no_pending_schedule"}
-
-            if auto_repay.auto_pay_full_amount:
-                amount = next_schedule.outstanding_amount + next_schedule.late_fee
-            elif auto_repay.custom_amount:
-                amount = min(
-                    auto_repay.custom_amount,
-                    next_schedule.outstanding_amount + next_schedule.late_fee,
+                if not auto_repay:
+                    # Missing, already recovered, or locked by a batch paying it
+                    return {"status": "skipped", "reason": "not_retryable"}
+
+                next_schedule = (
+                    LoanRepaymentSchedule.objects.filter(
+                        loan=auto_repay.loan,
+                        status__in=[RepaymentStatus.PENDING, RepaymentStatus.OVERDUE],
+                    )
+                    .order_by("installment_number")
+                    .first()
                 )
-            else:
-                amount = next_schedule.outstanding_amount + next_schedule.late_fee
 
-            if auto_repay.wallet.balance < amount:
-                AutoRepaymentTasks._handle_payment_failure(
-                    auto_repay,
-                    f"Insufficient balance on retry. Required: {amount}, Available: {auto_repay.wallet.balance}",
-                )
-                return {"status": "failed", "reason": "insufficient_balance"}
+                if not next_schedule:
+                    logger.info(
+                        f"No pending schedule for retry: {auto_repay.loan.application_id}"
+                    )
+                    return {"status": "skipped", "reason": "no_pending_schedule"}
 
-            # Process payment
-            user = auto_repay.loan.user
-            payment_data = MakeLoanRepaymentSchema(
-                wallet_id=auto_repay.wallet.wallet_id,
-                amount=amount,
-                schedule_id=next_schedule.schedule_id,
-                notes=f"Automatic repayment retry #{auto_repay.consecutive_failures}",
-            )
+                amount = auto_repay.payment_amount(next_schedule)
 
-            repayment = async_to_sync(LoanProcessor.make_repayment)(
-                user, auto_repay.loan.application_id, payment_data
-            )
+                if auto_repay.wallet.balance < amount:
+                    AutoRepaymentTasks._handle_payment_failure(
+                        auto_repay,
+                        f"Insufficient balance on retry. Required: {amount}, Available: {auto_repay.wallet.balance}",
+                    )
+                    return {"status": "failed", "reason": "insufficient_balance"}
+
+                # Process payment
+                user = auto_repay.loan.user
+                payment_data = MakeLoanRepaymentSchema(
+                    wallet_id=auto_repay.wallet.wallet_id,
+                    amount=amount,
+                    schedule_id=next_schedule.schedule_id,
+                    notes=f"Automatic repayment retry #{auto_repay.consecutive_failures}",
+                )
 
-            auto_repay.total_payments_made += 1
-            auto_repay.last_payment_date = timezone.now()
-            auto_repay.last_payment_amount = amount
-            auto_repay.consecutive_failures = 0  # Reset on success
-            auto_repay.save(
-                update_fields=[
-                    "total_payments_made",
-                    "last_payment_date",
-                    "last_payment_amount",
-                    "consecutive_failures",
-                    "updated_at",
-                ]
-            )
+                repayment = async_to_sync(LoanProcessor.make_repayment)(
+                    user, auto_repay.loan.application_id, payment_data
+                )
 
-            logger.info(
-                f"Auto-repayment retry successful: Loan {auto_repay.loan.application_id}"
-            )
+                auto_repay.total_payments_made += 1
+                auto_repay.last_payment_date = timezone.now()
+                auto_repay.last_payment_amount = amount
+                auto_repay.consecutive_failures = 0  # Reset on success
+                auto_repay.save(
+                    update_fields=[
+                        "total_payments_made",
+                        "last_payment_date",
+                        "last_payment_amount",
+                        "consecutive_failures",
+                        "updated_at",
+                    ]
+                )
 
-            if auto_repay.send_notification_on_success:
-                AutoRepaymentTasks.send_auto_repayment_notification.delay(
-                    auto_repay.id, "success", amount
+                logger.info(
+                    f"Auto-repayment retry successful: Loan {auto_repay.loan.application_id}"
                 )
 
-            return {"status": "success", "amount": str(amount)}
+                if auto_repay.send_notification_on_success:
+                    AutoRepaymentTasks.send_auto_repayment_notification.delay(
+                        auto_repay.id, "success", amount
+                    )
+
+                return {"status": "success", "amount": str(amount)}
 
         except Exception as e:
             logger.error(f"Auto-repayment retry failed: {str(e)}")
@@ -477,12 +646,64 @@ class AutoRepaymentTasks:
             logger.error(f"Failed to send auto-repayment notification: {str(e)}")
             return {"status": "failed", "error": str(e)}
 
+    @staticmethod
+    @shared_task(
+        name="loans.send_auto_repayment_notifications_bulk", queue="notifications"
+    )
+    def send_auto_repayment_notifications_bulk(
+        notifications: list, notification_type: str
+    ):
+        """
+        Send in-app auto-repayment notifications for a batch of (id, amount) pairs
+        Users whose messages read the same share one bulk insert and push
+        """
+
+        try:
+            if notification_type != "success":
+                return {"status": "skipped", "notification_type": notification_type}
+
+            amounts = {
+                auto_repayment_id: Decimal(str(amount))
+                for auto_repayment_id, amount in notifications
+            }
+            auto_repayments = AutoRepayment.objects.select_related(
+                "loan__user", "wallet__currency"
+            ).filter(id__in=amounts.keys(), loan__user__in_app_enabled=True)
+
+            users_by_message = defaultdict(list)
+            for auto_repay in auto_repayments:
+                amount = amounts[str(auto_repay.id)]
+                message = f"Your automatic loan repayment of {auto_repay.wallet.currency.symbol}{amount:,.2f} was successful"
+                users_by_message[message].append(auto_repay.loan.user)
+
+            sent_count = 0
+            for message, users in users_by_message.items():
+                result = NotificationService.bulk_create_notifications(
+                    users=users,
+                    title="Auto-Repayment Successful",
+                    message=message,
+                    notification_type=NotificationType.LOAN,
+                    priority=NotificationPriority.MEDIUM,
+                    related_object_type="AutoRepayment",
+                )
+                sent_count += result["created_count"]
+
+            return {
+                "status": "success",
+                "notification_type": notification_type,
+                "sent_count": sent_count,
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to send auto-repayment notifications: {str(e)}")
+            return {"status": "failed", "error": str(e)}
+
 
 class LoanMaintenanceTasks:
     """Loan system maintenance tasks"""
 
     @staticmethod
-    @shared_task(name="loans.update_overdue_schedules", queue="maintenance")
+    @shared_task(name="loans.update_overdue_schedules", queue="maintenance_transient")
     def update_overdue_schedules():
         """
         Update repayment schedules that are overdue
@@ -491,35 +712,37 @@ class LoanMaintenanceTasks:
 
         try:
             today = timezone.now().date()
-            updated_count = 0
 
             overdue_schedules = LoanRepaymentSchedule.objects.filter(
                 status__in=[RepaymentStatus.PENDING, RepaymentStatus.PARTIAL],
                 due_date__lt=today,
-            ).select_related("loan", "loan__loan_product")
-
-            for schedule in overdue_schedules:
-                days_overdue = (today - schedule.due_date).days
-                schedule.days_overdue = days_overdue
-                schedule.status = RepaymentStatus.OVERDUE
-
-                # Apply late fee if not already applied
-                if (
-                    schedule.late_fee == 0
-                    and schedule.loan.loan_product.late_payment_fee > 0
-                ):
-                    schedule.late_fee = schedule.loan.loan_product.late_payment_fee
-
-                schedule.save(
-                    update_fields=["days_overdue", "status", "late_fee", "updated_at"]
+            )
+            late_payment_fee = LoanProduct.objects.filter(
+                applications__id=OuterRef("loan_id")
+            ).values("late_payment_fee")[:1]
+
+            # Two set-based UPDATEs instead of saving schedule by schedule;
+            # loans are flagged first, while their schedules still match.
+            # CURRENT_TIMESTAMP is the transaction start, so both share one
+            # timestamp (Now() compiles to STATEMENT_TIMESTAMP() and would not)
+            with db_transaction.atomic():
+                LoanApplication.objects.filter(
+                    id__in=overdue_schedules.values("loan_id"),
+                    status=LoanStatus.ACTIVE,
+                ).update(status=LoanStatus.OVERDUE, updated_at=TransactionNow())
+
+                updated_count = overdue_schedules.update(
+                    # date - date is a whole number of days in Postgres
+                    days_overdue=RawSQL("(%s::date - due_date)", [today]),
+                    status=RepaymentStatus.OVERDUE,
+                    # Apply late fee if not already applied
+                    late_fee=Case(
+                        When(late_fee=0, then=Subquery(late_payment_fee)),
+                        default=F("late_fee"),
+                    ),
+                    updated_at=TransactionNow(),
                 )
 
-                if schedule.loan.status == LoanStatus.ACTIVE:
-                    schedule.loan.status = LoanStatus.OVERDUE
-                    schedule.loan.save(update_fields=["status", "updated_at"])
-
-                updated_count += 1
-
             logger.info(f"Updated {updated_count} overdue schedules")
             return {"status": "success", "updated_count": updated_count}
 
@@ -528,7 +751,7 @@ class LoanMaintenanceTasks:
             return {"status": "failed", "error": str(e)}
 
     @staticmethod
-    @shared_task(name="loans.cleanup_old_credit_scores", queue="maintenance")
+    @shared_task(name="loans.cleanup_old_credit_scores", queue="maintenance_transient")
     def cleanup_old_credit_scores():
         """
         Clean up old credit score records, keeping only the latest per user
@@ -551,11 +774,11 @@ class LoanMaintenanceTasks:
                     order_by=F("created_at").desc(),
                 )
             )
-            scores_to_delete = scores_with_rank.filter(rank__gt=10).values_list(
-                "id", flat=True
-            )
+            # Kept as a subquery so the ranking and the DELETE run in one
+            # statement, without pulling the ids into Python
+            scores_to_delete = scores_with_rank.filter(rank__gt=10).values("id")
             deleted_count, _ = CreditScore.objects.filter(
-                id__in=list(scores_to_delete)
+                id__in=scores_to_delete
             ).delete()
 
             logger.info(f"Cleaned up {deleted_count} old credit score records")
@@ -663,8 +886,13 @@ class LoanEmailTasks:
 auto_approve_loan = LoanApprovalTasks.auto_approve_loan
 auto_disburse_loan = LoanApprovalTasks.auto_disburse_loan
 process_auto_repayments = AutoRepaymentTasks.process_auto_repayments
+process_user_auto_repayments = AutoRepaymentTasks.process_user_auto_repayments
+retry_due_auto_repayments = AutoRepaymentTasks.retry_due_auto_repayments
 retry_failed_auto_repayment = AutoRepaymentTasks.retry_failed_auto_repayment
 send_auto_repayment_notification = AutoRepaymentTasks.send_auto_repayment_notification
+send_auto_repayment_notifications_bulk = (
+    AutoRepaymentTasks.send_auto_repayment_notifications_bulk
+)
 update_overdue_schedules = LoanMaintenanceTasks.update_overdue_schedules
 cleanup_old_credit_scores = LoanMaintenanceTasks.cleanup_old_credit_scores
 send_loan_approved_email_async = LoanEmailTasks.send_loan_approved_email
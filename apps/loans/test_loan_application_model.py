@@ -0,0 +1,89 @@
+"""
+Unit tests for the LoanApplication model (apps/loans/models.py)
+
+Covers the product name/type snapshot copied onto the application.
+"""
+
+import pytest
+from decimal import Decimal
+
+from apps.loans.models import (
+    LoanApplication,
+    LoanProduct,
+    LoanProductType,
+    RepaymentFrequency,
+)
+
+
+async def create_application(user, wallet, product):
+    return await LoanApplication.objects.acreate(
+        user=user,
+        loan_product=product,
+        wallet=wallet,
+        requested_amount=Decimal("50000.00"),
+        interest_rate=Decimal("15.00"),
+        tenure_months=6,
+        repayment_frequency=RepaymentFrequency.MONTHLY,
+        purpose="School fees",
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.loan
+class TestLoanProductSnapshot:
+    """Test the product display fields stored on the application."""
+
+    @pytest.mark.django_db(transaction=True)
+    async def test_snapshot_copied_on_create(
+        self, verified_user, user_wallet, loan_product
+    ):
+        application = await create_application(verified_user, user_wallet, loan_product)
+
+        assert application.loan_product_name == "Personal Loan"
+        assert application.loan_product_type == LoanProductType.PERSONAL
+
+    @pytest.mark.django_db(transaction=True)
+    async def test_snapshot_recopied_when_product_changes(
+        self, verified_user, user_wallet, loan_product, ngn_currency
+    ):
+        """Switching a loaded application to another product refreshes the copy."""
+        business_product = await LoanProduct.objects.acreate(
+            name="Business Loan",
+            description="Working capital loan",
+            product_type=LoanProductType.BUSINESS,
+            currency=ngn_currency,
+            min_amount=Decimal("10000.00"),
+            max_amount=Decimal("500000.00"),
+            min_interest_rate=Decimal("15.00"),
+            max_interest_rate=Decimal("20.00"),
+            min_tenure_months=3,
+            max_tenure_months=12,
+            allowed_repayment_frequencies=[RepaymentFrequency.MONTHLY],
+            is_active=True,
+        )
+        application = await create_application(verified_user, user_wallet, loan_product)
+
+        loaded = await LoanApplication.objects.aget(id=application.id)
+        loaded.loan_product = business_product
+        await loaded.asave(update_fields=["loan_product"])
+
+        stored = await LoanApplication.objects.aget(id=application.id)
+        assert stored.loan_product_name == "Business Loan"
+        assert stored.loan_product_type == LoanProductType.BUSINESS
+
+    @pytest.mark.django_db(transaction=True)
+    async def test_unrelated_save_keeps_snapshot(
+        self, verified_user, user_wallet, loan_product
+    ):
+        """Saving without a product change does not reread the product."""
+        application = await create_application(verified_user, user_wallet, loan_product)
+        await LoanApplication.objects.filter(id=application.id).aupdate(
+            loan_product_name="Renamed Elsewhere"
+        )
+
+        loaded = await LoanApplication.objects.aget(id=application.id)
+        loaded.purpose = "Rent"
+        await loaded.asave()
+
+        stored = await LoanApplication.objects.aget(id=application.id)
+        assert stored.loan_product_name == "Renamed Elsewhere"
@@ -0,0 +1,64 @@
+"""
+Unit tests for loan signals (apps/loans/signals.py)
+
+Tests that the product listing cache is cleared only once a change commits.
+"""
+
+import pytest
+from decimal import Decimal
+from unittest.mock import patch
+from django.db import transaction
+
+from apps.common.cache import CacheManager
+from apps.loans.models import LoanProduct, LoanProductType, RepaymentFrequency
+from apps.wallets.models import Currency
+
+
+@pytest.fixture
+def product():
+    currency, _ = Currency.objects.get_or_create(
+        code="NGN", defaults={"name": "Nigerian Naira", "symbol": "₦"}
+    )
+    return LoanProduct.objects.create(
+        name="Personal Loan",
+        description="Standard personal loan",
+        product_type=LoanProductType.PERSONAL,
+        currency=currency,
+        min_amount=Decimal("10000.00"),
+        max_amount=Decimal("500000.00"),
+        min_interest_rate=Decimal("15.00"),
+        max_interest_rate=Decimal("20.00"),
+        min_tenure_months=3,
+        max_tenure_months=12,
+        allowed_repayment_frequencies=[RepaymentFrequency.MONTHLY],
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.loan
+class TestLoanProductListCacheInvalidation:
+    """Test the LoanProduct post_save cache invalidation."""
+
+    @pytest.mark.django_db
+    def test_cache_cleared_after_commit(
+        self, product, django_capture_on_commit_callbacks
+    ):
+        with patch.object(CacheManager, "delete_pattern") as delete_pattern:
+            with django_capture_on_commit_callbacks(execute=True):
+                product.name = "Renamed Loan"
+                product.save()
+                delete_pattern.assert_not_called()
+
+        delete_pattern.assert_called_once_with("paycore:loans:products:list*")
+
+    @pytest.mark.django_db
+    def test_cache_kept_on_rollback(self, product, django_capture_on_commit_callbacks):
+        with patch.object(CacheManager, "delete_pattern") as delete_pattern:
+            with django_capture_on_commit_callbacks(execute=True):
+                with pytest.raises(RuntimeError):
+                    with transaction.atomic():
+                        product.name = "Renamed Loan"
+                        product.save()
+                        raise RuntimeError
+
+        delete_pattern.assert_not_called()
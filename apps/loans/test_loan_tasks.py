@@ -0,0 +1,130 @@
+"""
+Unit tests for Loan maintenance tasks (apps/loans/tasks.py)
+
+Tests the overdue sweep: days overdue, late fees and the loan status flip.
+These are UNIT tests - testing business logic directly, not API endpoints.
+"""
+
+import pytest
+from datetime import timedelta
+from decimal import Decimal
+from asgiref.sync import sync_to_async
+from django.utils import timezone
+
+from apps.loans.models import (
+    LoanApplication,
+    LoanRepaymentSchedule,
+    LoanStatus,
+    RepaymentFrequency,
+    RepaymentStatus,
+)
+from apps.loans.tasks import LoanMaintenanceTasks
+
+
+@pytest.fixture
+async def active_loan(verified_user, user_wallet, loan_product):
+    loan_product.late_payment_fee = Decimal("500.00")
+    await loan_product.asave(update_fields=["late_payment_fee"])
+    return await LoanApplication.objects.acreate(
+        user=verified_user,
+        loan_product=loan_product,
+        wallet=user_wallet,
+        requested_amount=Decimal("30000.00"),
+        interest_rate=Decimal("15.00"),
+        tenure_months=3,
+        repayment_frequency=RepaymentFrequency.MONTHLY,
+        purpose="School fees",
+        status=LoanStatus.ACTIVE,
+    )
+
+
+async def create_schedule(loan, installment_number, days_from_today, late_fee=0):
+    return await LoanRepaymentSchedule.objects.acreate(
+        loan=loan,
+        installment_number=installment_number,
+        due_date=timezone.now().date() + timedelta(days=days_from_today),
+        principal_amount=Decimal("10000.00"),
+        interest_amount=Decimal("125.00"),
+        total_amount=Decimal("10125.00"),
+        outstanding_amount=Decimal("10125.00"),
+        late_fee=Decimal(late_fee),
+    )
+
+
+async def run_update_overdue_schedules():
+    return await sync_to_async(LoanMaintenanceTasks.update_overdue_schedules)()
+
+
+@pytest.mark.unit
+@pytest.mark.loan
+class TestUpdateOverdueSchedules:
+    """Test the periodic overdue sweep."""
+
+    @pytest.mark.django_db(transaction=True)
+    async def test_marks_past_due_schedules_overdue(self, active_loan):
+        overdue = await create_schedule(active_loan, 1, -5)
+        upcoming = await create_schedule(active_loan, 2, 10)
+
+        result = await run_update_overdue_schedules()
+
+        assert result == {"status": "success", "updated_count": 1}
+        await overdue.arefresh_from_db()
+        assert overdue.status == RepaymentStatus.OVERDUE
+        assert overdue.days_overdue == 5
+        assert overdue.late_fee == Decimal("500.00")
+        await upcoming.arefresh_from_db()
+        assert upcoming.status == RepaymentStatus.PENDING
+        assert upcoming.days_overdue == 0
+        assert upcoming.late_fee == Decimal("0.00")
+
+    @pytest.mark.django_db(transaction=True)
+    async def test_late_fee_applied_once(self, active_loan):
+        """A second sweep leaves an already-overdue schedule's fee alone."""
+        schedule = await create_schedule(active_loan, 1, -5)
+
+        await run_update_overdue_schedules()
+        result = await run_update_overdue_schedules()
+
+        assert result["updated_count"] == 0
+        await schedule.arefresh_from_db()
+        assert schedule.late_fee == Decimal("500.00")
+
+    @pytest.mark.django_db(transaction=True)
+    async def test_existing_late_fee_kept(self, active_loan):
+        schedule = await create_schedule(active_loan, 1, -3, late_fee="250.00")
+
+        await run_update_overdue_schedules()
+
+        await schedule.arefresh_from_db()
+        assert schedule.status == RepaymentStatus.OVERDUE
+        assert schedule.days_overdue == 3
+        assert schedule.late_fee == Decimal("250.00")
+
+    @pytest.mark.django_db(transaction=True)
+    async def test_active_loan_flipped_to_overdue(self, active_loan):
+        await create_schedule(active_loan, 1, -1)
+
+        await run_update_overdue_schedules()
+
+        await active_loan.arefresh_from_db()
+        assert active_loan.status == LoanStatus.OVERDUE
+
+    @pytest.mark.django_db(transaction=True)
+    async def test_loan_without_past_due_schedules_stays_active(self, active_loan):
+        await create_schedule(active_loan, 1, 10)
+
+        await run_update_overdue_schedules()
+
+        await active_loan.arefresh_from_db()
+        assert active_loan.status == LoanStatus.ACTIVE
+
+    @pytest.mark.django_db(transaction=True)
+    async def test_loan_and_schedules_share_one_timestamp(self, active_loan):
+        """Both UPDATEs stamp updated_at with the sweep transaction's start."""
+        schedule = await create_schedule(active_loan, 1, -2)
+
+        await run_update_overdue_schedules()
+
+        await active_loan.arefresh_from_db()
+        await schedule.arefresh_from_db()
+        assert active_loan.updated_at == schedule.updated_at
@@ -4,6 +4,7 @@ from typing import Optional
 from ninja import Query, Router
 from django.conf import settings
 
+from apps.common.cache import cacheable
 from apps.common.responses import CustomResponse
 from apps.common.schemas import PaginationQuerySchema
 from apps.loans.models import LoanProductType, LoanRepayment
@@ -43,6 +44,7 @@ loan_router = Router(tags=["Loans (20)"])
     summary="List loan products",
     response={200: LoanProductListDataResponseSchema},
 )
+@cacheable(key="loans:products:list", ttl=300)
 async def list_loan_products(
     request,
     currency_code: Optional[str] = None,
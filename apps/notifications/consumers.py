@@ -1,14 +1,23 @@
-import json, logging
-from urllib.parse import parse_qs
+import asyncio, json, logging
 from channels.generic.websocket import AsyncWebsocketConsumer
 from django.contrib.auth import get_user_model
-from apps.accounts.auth import Authentication
+from apps.notifications.middlewares import (
+    get_token_from_query_string,
+    get_user_from_token,
+)
 from apps.notifications.models import Notification
+from apps.notifications.services.unread import UnreadCountCache
 from django.utils import timezone
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
+# Most notification ids a single mark_read command will update
+MAX_MARK_READ_IDS = 500
+
+# A burst of notifications inside this window yields one unread_count frame
+UNREAD_COUNT_DEBOUNCE_SECONDS = 0.25
+
 
 class NotificationConsumer(AsyncWebsocketConsumer):
     """
@@ -16,11 +25,12 @@ class NotificationConsumer(AsyncWebsocketConsumer):
     Connection URL: ws://domain.com/ws/notifications/?token=<access_token>
     """
 
+    last_unread_count = None
+    unread_count_flush = None
+
     async def connect(self):
-        query_string = self.scope.get("query_string", b"").decode()
-        query_params = parse_qs(query_string)
-        token = query_params.get("token", [None])[0]
-        user = await Authentication.retrieve_user_from_token(token)
+        token = get_token_from_query_string(self.scope.get("query_string", b""))
+        user = await get_user_from_token(token)
         if not user:
             logger.warning("Unauthorized WebSocket connection attempt")
             await self.close()
@@ -28,18 +38,20 @@ class NotificationConsumer(AsyncWebsocketConsumer):
         self.scope["user"] = self.user = user
         self.user_group_name = f"user_{user.id}_notifications"
 
-        # Join user's notification group
-        await self.channel_layer.group_add(self.user_group_name, self.channel_name)
+        # Join user's notification group while fetching the initial unread count
+        _, unread_count = await asyncio.gather(
+            self.channel_layer.group_add(self.user_group_name, self.channel_name),
+            self.get_unread_count(),
+        )
         await self.accept()
         logger.info(f"WebSocket connected for user {user.id}")
 
         # Send initial unread count
-        unread_count = await self.get_unread_count()
-        await self.send(
-            text_data=json.dumps({"type": "unread_count", "count": unread_count})
-        )
+        await self.send_unread_count(unread_count)
 
     async def disconnect(self, close_code):
+        if self.unread_count_flush and not self.unread_count_flush.done():
+            self.unread_count_flush.cancel()
         if hasattr(self, "user_group_name"):
             await self.channel_layer.group_discard(
                 self.user_group_name, self.channel_name
@@ -62,72 +74,74 @@ class NotificationConsumer(AsyncWebsocketConsumer):
             command = data.get("command")
 
             if command == "get_unread_count":
-                unread_count = await self.get_unread_count()
-                await self.send(
-                    text_data=json.dumps(
-                        {"type": "unread_count", "count": unread_count}
-                    )
-                )
+                await self.send_unread_count(await self.get_unread_count())
 
             elif command == "mark_read":
                 notification_ids = data.get("notification_ids", [])
                 if notification_ids:
                     count = await self.mark_notifications_read(notification_ids)
-                    await self.send(
-                        text_data=json.dumps(
-                            {
-                                "type": "mark_read_response",
-                                "count": count,
-                                "notification_ids": notification_ids,
-                            }
-                        )
+                    await self.send_json(
+                        {
+                            "type": "mark_read_response",
+                            "count": count,
+                            "notification_ids": notification_ids,
+                        }
                     )
 
             elif command == "ping":
-                await self.send(
-                    text_data=json.dumps(
-                        {"type": "pong", "timestamp": str(timezone.now())}
-                    )
-                )
+                await self.send_json({"type": "pong", "timestamp": str(timezone.now())})
 
             else:
-                await self.send(
-                    text_data=json.dumps(
-                        {"type": "error", "message": f"Unknown command: {command}"}
-                    )
+                await self.send_json(
+                    {"type": "error", "message": f"Unknown command: {command}"}
                 )
 
         except json.JSONDecodeError:
-            await self.send(
-                text_data=json.dumps({"type": "error", "message": "Invalid JSON"})
-            )
+            await self.send_json({"type": "error", "message": "Invalid JSON"})
         except Exception as e:
             logger.error(f"Error in WebSocket receive: {str(e)}")
-            await self.send(
-                text_data=json.dumps({"type": "error", "message": "Internal error"})
-            )
+            await self.send_json({"type": "error", "message": "Internal error"})
 
     async def notification_message(self, event):
         notification_data = event["notification"]
 
         # Send notification to WebSocket
-        await self.send(
-            text_data=json.dumps(
-                {"type": "notification", "notification": notification_data}
-            )
+        await self.send_json(
+            {"type": "notification", "notification": notification_data}
         )
 
-        # Also send updated unread count
-        unread_count = await self.get_unread_count()
-        await self.send(
-            text_data=json.dumps({"type": "unread_count", "count": unread_count})
-        )
+        # Follow up with the unread count once the burst settles
+        if not self.unread_count_flush or self.unread_count_flush.done():
+            self.unread_count_flush = asyncio.create_task(self.flush_unread_count())
+
+    async def flush_unread_count(self):
+        try:
+            await asyncio.sleep(UNREAD_COUNT_DEBOUNCE_SECONDS)
+            unread_count = await self.get_unread_count()
+            if unread_count != self.last_unread_count:
+                await self.send_unread_count(unread_count)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error sending unread count: {str(e)}")
+
+    async def send_unread_count(self, unread_count):
+        self.last_unread_count = unread_count
+        await self.send_json({"type": "unread_count", "count": unread_count})
+
+    async def send_json(self, content):
+        # Compact separators keep frames small on busy fan-outs
+        await self.send(text_data=json.dumps(content, separators=(",", ":")))
 
     async def get_unread_count(self):
-        return await Notification.objects.filter(user=self.user, is_read=False).acount()
+        return await UnreadCountCache.aget(self.user.id)
 
     async def mark_notifications_read(self, notification_ids):
+        # Client-supplied: drop duplicates and cap what one UPDATE may touch
+        notification_ids = list(dict.fromkeys(notification_ids))[:MAX_MARK_READ_IDS]
         updated = await Notification.objects.filter(
-            notification_id__in=notification_ids, user=self.user, is_read=False
+            id__in=notification_ids, user=self.user, is_read=False
         ).aupdate(is_read=True, read_at=timezone.now())
+        if updated:
+            await UnreadCountCache.aincr(self.user.id, -updated)
         return updated
@@ -1,9 +1,60 @@
-from urllib.parse import parse_qs
+from urllib.parse import unquote_plus
+from cachetools import TLRUCache
 from apps.accounts.auth import Authentication
-import logging
+from apps.accounts.models import User
+import hashlib, logging, re, time
 
 logger = logging.getLogger(__name__)
 
+# Authenticated users keyed by a digest of their access token, so reconnects
+# with the same token skip the JWT decode and the user lookup. An entry lives
+# for at most WS_USER_CACHE_TTL seconds and never past the token's own expiry;
+# the TTL bounds how long a logged-out token can still open a socket.
+WS_USER_CACHE_TTL = 30
+
+
+def _ws_user_ttu(key, value, now):
+    _, expires_at = value
+    return now + min(WS_USER_CACHE_TTL, expires_at - time.time())
+
+
+_WS_USER_CACHE = TLRUCache(maxsize=10_000, ttu=_ws_user_ttu)
+
+_TOKEN_PARAM_RE = re.compile(rb"(?:^|&)token=([^&]*)")
+
+
+def get_token_from_query_string(query_string: bytes):
+    """Pull the token parameter out of a raw query string without parsing the rest"""
+    match = _TOKEN_PARAM_RE.search(query_string)
+    if not match:
+        return None
+    return unquote_plus(match.group(1).decode()) or None
+
+
+def _token_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+async def get_user_from_token(token: str):
+    """Resolve a WebSocket access token to its user, caching hits briefly"""
+    if not token:
+        return None
+    key = _token_key(token)
+    cached = _WS_USER_CACHE.get(key)
+    if cached is not None:
+        return cached[0]
+
+    decoded = Authentication.decode_jwt(token, "access")
+    if not decoded:
+        return None
+    # Still checked against the stored access token, so logged-out tokens fail
+    user = await User.objects.aget_or_none(
+        id=decoded["user_id"], access=token, is_active=True
+    )
+    if user:
+        _WS_USER_CACHE[key] = (user, decoded["exp"])
+    return user
+
 
 class NotificationAuthMiddleware:
     """
@@ -14,9 +65,8 @@ class NotificationAuthMiddleware:
         self.app = app
 
     async def __call__(self, scope, receive, send):
-        query_string = scope.get("query_string", b"").decode()
-        query_params = parse_qs(query_string)
-        token = query_params.get("token", [None])[0]
+        query_string = scope.get("query_string", b"")
+        token = get_token_from_query_string(query_string)
 
         print("=" * 80)
         print("🔍 WebSocket Connection Attempt")
@@ -30,7 +80,7 @@ class NotificationAuthMiddleware:
         if token:
             try:
                 print("🔐 Attempting to retrieve user from token...")
-                user = await Authentication.retrieve_user_from_token(token)
+                user = await get_user_from_token(token)
                 print(f"👤 User retrieved: {user}")
                 scope["user"] = user
                 if user:
@@ -38,7 +88,7 @@ class NotificationAuthMiddleware:
                     logger.info(f"WebSocket authenticated for user: {user.id}")
                 else:
                     print("❌ WebSocket auth failed: Invalid token (user is None)")
-                    logger.warning(f"WebSocket auth failed: Invalid token")
+                    logger.warning("WebSocket auth failed: Invalid token")
             except Exception as e:
                 print(f"❌ WebSocket auth error: {str(e)}")
                 print(f"❌ Error type: {type(e).__name__}")
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-16 17:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications", "0006_alter_notification_notification_type_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                condition=models.Q(("is_read", False)),
+                fields=["user"],
+                name="notification_user_unread_idx",
+            ),
+        ),
+    ]
@@ -109,6 +109,12 @@ class Notification(BaseModel):
             models.Index(fields=["user", "-created_at"]),
             models.Index(fields=["user", "is_read", "-created_at"]),
             models.Index(fields=["notification_type", "-created_at"]),
+            # Unread rows only; stays small as read notifications accumulate
+            models.Index(
+                fields=["user"],
+                condition=models.Q(is_read=False),
+                name="notification_user_unread_idx",
+            ),
         ]
 
     def __str__(self):
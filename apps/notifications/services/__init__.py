@@ -5,14 +5,17 @@ This package contains all notification-related services:
 - base.py: Core notification service with bulk operations
 - fcm.py: Firebase Cloud Messaging push notifications
 - websocket.py: Real-time WebSocket notifications
+- unread.py: Redis-backed per-user unread counts
 """
 
 from .base import NotificationService
 from .fcm import FCMService
 from .websocket import WebSocketService
+from .unread import UnreadCountCache
 
 __all__ = [
     "NotificationService",
     "FCMService",
     "WebSocketService",
+    "UnreadCountCache",
 ]
@@ -15,6 +15,7 @@ from apps.common.paginators import Paginator
 from apps.notifications.schemas import MarkNotificationsReadSchema
 from apps.notifications.services.fcm import FCMService
 from apps.notifications.services.websocket import WebSocketService
+from apps.notifications.services.unread import UnreadCountCache
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
@@ -63,6 +64,7 @@ class NotificationService:
                 metadata=metadata or {},
                 expires_at=expires_at,
             )
+            UnreadCountCache.incr([user.id])
             logger.info(
                 f"✅ Created notification {notification.id} for user {user.id}: {title} (type={notification_type})"
             )
@@ -140,12 +142,14 @@ class NotificationService:
         query = Q(expires_at__isnull=True) | Q(expires_at__gt=timezone.now())
         notifications = Notification.objects.filter(user=user).filter(query)
         notifications = filters.filter(notifications)
-        unread_count = await Notification.objects.filter(
-            user=user, is_read=False
-        ).acount()
+        unread_count = await UnreadCountCache.aget(user.id)
 
         paginated_data = await Paginator.paginate_queryset(
-            notifications.order_by("-created_at"), page_params.page, page_params.limit
+            notifications,
+            page_params.page,
+            page_params.limit,
+            keyset=True,
+            cursor=page_params.cursor,
         )
         paginated_data["unread_count"] = unread_count
         return paginated_data
@@ -154,9 +158,12 @@ class NotificationService:
     async def mark_as_read(user: User, payload: MarkNotificationsReadSchema) -> int:
         notification_ids = payload.notification_ids
         filters = {} if len(notification_ids) < 1 else {"id__in": notification_ids}
-        return await Notification.objects.filter(
+        updated = await Notification.objects.filter(
             user=user, is_read=False, **filters
         ).aupdate(is_read=True, read_at=timezone.now())
+        if updated:
+            await UnreadCountCache.aincr(user.id, -updated)
+        return updated
 
     @staticmethod
     async def delete_notifications(
@@ -165,6 +172,7 @@ class NotificationService:
         notification_ids = payload.notification_ids
         filters = {} if len(notification_ids) < 1 else {"id__in": notification_ids}
         await Notification.objects.filter(user=user, **filters).adelete()
+        await UnreadCountCache.ainvalidate(user.id)
 
     @staticmethod
     async def get_notification_stats(user: User) -> Dict[str, Any]:
@@ -257,6 +265,7 @@ class NotificationService:
                 [Notification(user=user, **notification_data) for user in users_list]
             )
             created_count = len(created_notifications)
+            UnreadCountCache.incr(user.id for user in users_list)
 
             logger.info(
                 f"Bulk created {created_count} notifications for {len(users_list)} users"
@@ -0,0 +1,103 @@
+from typing import Iterable, Optional
+from django.db import transaction
+from django_redis import get_redis_connection
+import logging
+
+from apps.common.cache import get_async_redis
+from apps.notifications.models import Notification
+
+logger = logging.getLogger(__name__)
+
+# Counters are only adjusted while present; a missing key is rebuilt from a
+# COUNT on the next read. Increments wait for the insert to commit; the TTL
+# bounds drift from writes that bypass these helpers (admin edits, a create
+# racing a repopulate).
+UNREAD_COUNT_TTL = 3600
+
+# Adjust a counter only if it is cached, never letting it drop below zero.
+ADJUST_IF_PRESENT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    local value = redis.call('INCRBY', KEYS[1], ARGV[1])
+    if value < 0 then
+        redis.call('SET', KEYS[1], 0, 'KEEPTTL')
+        return 0
+    end
+    return value
+end
+return false
+"""
+
+
+class UnreadCountCache:
+    """Per-user unread notification count kept in Redis"""
+
+    @staticmethod
+    def key(user_id) -> str:
+        return f"paycore:notifications:unread:{user_id}"
+
+    @staticmethod
+    async def aget(user_id) -> int:
+        key = UnreadCountCache.key(user_id)
+        try:
+            cached = await get_async_redis().get(key)
+            if cached is not None:
+                return int(cached)
+        except Exception as e:
+            logger.error(f"Unread count GET error for user {user_id}: {e}")
+
+        count = await Notification.objects.filter(
+            user_id=user_id, is_read=False
+        ).acount()
+        try:
+            await get_async_redis().set(key, count, ex=UNREAD_COUNT_TTL, nx=True)
+        except Exception as e:
+            logger.error(f"Unread count SET error for user {user_id}: {e}")
+        return count
+
+    @staticmethod
+    def incr(user_ids: Iterable, amount: int = 1) -> None:
+        """
+        Adjust the cached counters once the surrounding transaction commits,
+        so a rolled-back notification insert never bumps the count
+        """
+        user_ids = list(user_ids)
+        transaction.on_commit(lambda: UnreadCountCache._adjust(user_ids, amount))
+
+    @staticmethod
+    def _adjust(user_ids: Iterable, amount: int) -> None:
+        try:
+            redis_client = get_redis_connection("default")
+            adjust = redis_client.register_script(ADJUST_IF_PRESENT)
+            pipe = redis_client.pipeline(transaction=False)
+            for user_id in user_ids:
+                adjust(keys=[UnreadCountCache.key(user_id)], args=[amount], client=pipe)
+            pipe.execute()
+        except Exception as e:
+            logger.error(f"Unread count INCR error: {e}")
+
+    @staticmethod
+    async def aincr(user_id, amount: int = 1) -> Optional[int]:
+        try:
+            adjust = get_async_redis().register_script(ADJUST_IF_PRESENT)
+            value = await adjust(keys=[UnreadCountCache.key(user_id)], args=[amount])
+            return None if value is None else int(value)
+        except Exception as e:
+            logger.error(f"Unread count INCR error for user {user_id}: {e}")
+            return None
+
+    @staticmethod
+    def invalidate(user_ids: Iterable) -> None:
+        keys = [UnreadCountCache.key(user_id) for user_id in user_ids]
+        if not keys:
+            return
+        try:
+            get_redis_connection("default").delete(*keys)
+        except Exception as e:
+            logger.error(f"Unread count DELETE error: {e}")
+
+    @staticmethod
+    async def ainvalidate(user_id) -> None:
+        try:
+            await get_async_redis().delete(UnreadCountCache.key(user_id))
+        except Exception as e:
+            logger.error(f"Unread count DELETE error for user {user_id}: {e}")
@@ -8,7 +8,7 @@ from typing import Dict, Any, List
 import logging
 
 from apps.notifications.models import Notification
-from apps.notifications.services import NotificationService
+from apps.notifications.services import NotificationService, UnreadCountCache
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
@@ -141,7 +141,9 @@ class NotificationCleanupTasks:
     """Tasks for cleaning up old notifications"""
 
     @staticmethod
-    @shared_task(name="notifications.cleanup_old_notifications", queue="maintenance")
+    @shared_task(
+        name="notifications.cleanup_old_notifications", queue="maintenance_transient"
+    )
     def cleanup_old_notifications():
         """
         Delete old read notifications based on retention policy
@@ -166,13 +168,19 @@ class NotificationCleanupTasks:
 
     @staticmethod
     @shared_task(
-        name="notifications.cleanup_expired_notifications", queue="maintenance"
+        name="notifications.cleanup_expired_notifications",
+        queue="maintenance_transient",
     )
     def cleanup_expired_notifications():
         try:
-            deleted_count, _ = Notification.objects.filter(
-                expires_at__lte=timezone.now()
-            ).delete()
+            expired = Notification.objects.filter(expires_at__lte=timezone.now())
+            affected_user_ids = list(
+                expired.filter(is_read=False)
+                .values_list("user_id", flat=True)
+                .distinct()
+            )
+            deleted_count, _ = expired.delete()
+            UnreadCountCache.invalidate(affected_user_ids)
 
             logger.info(f"Deleted {deleted_count} expired notifications")
 
@@ -1,15 +1,89 @@
 from django.template.loader import render_to_string
-from django.core.mail import EmailMessage
+from django.core.mail import EmailMessage, get_connection
 from django.conf import settings
-import logging
+import logging, smtplib
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+FRONTEND_URL = getattr(settings, "FRONTEND_URL", "http://localhost:5173")
+TRANSACTIONS_URL = f"{FRONTEND_URL}/transactions"
+TERMS_URL = f"{FRONTEND_URL}/terms"
+PRIVACY_URL = f"{FRONTEND_URL}/privacy"
+
+# English month names, matching strftime("%B") under the C locale
+_MONTHS = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+
+
+def _format_date(value) -> str:
+    """Same output as strftime("%B %d, %Y") without the libc round-trip"""
+    return f"{_MONTHS[value.month - 1]} {value.day:02d}, {value.year}"
+
+
+def _format_datetime(value) -> str:
+    """Same output as strftime("%B %d, %Y at %I:%M %p")"""
+    hour12 = (value.hour + 11) % 12 + 1
+    meridiem = "AM" if value.hour < 12 else "PM"
+    return f"{_format_date(value)} at {hour12:02d}:{value.minute:02d} {meridiem}"
+
 
 class PaymentEmailUtil:
     """Email utilities for payment-related notifications"""
 
+    # Mail backend connection kept open across sends in this worker process
+    _connection = None
+
+    @classmethod
+    def _deliver(cls, email_message):
+        """
+        Send over the shared connection, reopening it once if the server dropped it
+        Any other failure may come after the server accepted the message, so it
+        is never retried; the connection is discarded and the error propagates
+        """
+        for attempt in range(2):
+            if cls._connection is None:
+                connection = get_connection()
+                try:
+                    connection.open()
+                except OSError:
+                    # Nothing was sent yet, so trying a fresh connection is safe
+                    if attempt:
+                        raise
+                    continue
+                cls._connection = connection
+            try:
+                cls._connection.send_messages([email_message])
+                return
+            except smtplib.SMTPServerDisconnected:
+                # Servers drop idle sessions; retry on a fresh one
+                cls._discard_connection()
+                if attempt:
+                    raise
+            except Exception:
+                cls._discard_connection()
+                raise
+
+    @classmethod
+    def _discard_connection(cls):
+        try:
+            cls._connection.close()
+        except OSError:
+            pass
+        cls._connection = None
+
     @classmethod
     def _send_email(cls, subject, template_name, context, recipient):
         """Internal helper to render template and send email."""
@@ -17,7 +91,7 @@ class PaymentEmailUtil:
             message = render_to_string(template_name, context)
             email_message = EmailMessage(subject=subject, body=message, to=[recipient])
             email_message.content_subtype = "html"
-            email_message.send()
+            cls._deliver(email_message)
             logger.info(f"Email sent successfully to {recipient}: {subject}")
         except Exception as e:
             logger.error(f"Email sending failed for {recipient}: {e}", exc_info=True)
@@ -26,9 +100,7 @@ class PaymentEmailUtil:
     def send_invoice_email(cls, invoice):
         """Send invoice notification to customer"""
         try:
-            # Get the frontend URL from settings or use default
-            frontend_url = getattr(settings, "FRONTEND_URL", "http://localhost:5173")
-            invoice_url = f"{frontend_url}/invoices/{invoice.invoice_number}"
+            invoice_url = f"{FRONTEND_URL}/invoices/{invoice.invoice_number}"
 
             # Get invoice items
             from apps.payments.models import InvoiceItem
@@ -56,8 +128,8 @@ class PaymentEmailUtil:
                 "invoice_number": invoice.invoice_number,
                 "invoice_title": invoice.title,
                 "invoice_description": invoice.description,
-                "issue_date": invoice.issue_date.strftime("%B %d, %Y"),
-                "due_date": invoice.due_date.strftime("%B %d, %Y"),
+                "issue_date": _format_date(invoice.issue_date),
+                "due_date": _format_date(invoice.due_date),
                 "items": formatted_items,
                 "subtotal": f"{invoice.subtotal:,.2f}",
                 "tax_amount": (
@@ -91,10 +163,6 @@ class PaymentEmailUtil:
     def send_payment_confirmation_email(cls, payment):
         """Send payment confirmation email to payer"""
         try:
-            # Get the frontend URL from settings or use default
-            frontend_url = getattr(settings, "FRONTEND_URL", "http://localhost:5173")
-            transaction_url = f"{frontend_url}/transactions"
-
             # Determine payment description
             if payment.payment_link:
                 payment_description = payment.payment_link.title
@@ -107,7 +175,7 @@ class PaymentEmailUtil:
                 "payer_name": payment.payer_name,
                 "merchant_name": payment.merchant_user.full_name,
                 "reference": payment.reference,
-                "payment_date": payment.created_at.strftime("%B %d, %Y at %I:%M %p"),
+                "payment_date": _format_datetime(payment.created_at),
                 "payment_description": payment_description,
                 "amount": f"{payment.amount:,.2f}",
                 "fee_amount": f"{payment.fee_amount:,.2f}",
@@ -117,10 +185,10 @@ class PaymentEmailUtil:
                 "invoice_number": (
                     payment.invoice.invoice_number if payment.invoice else None
                 ),
-                "transaction_url": transaction_url,
+                "transaction_url": TRANSACTIONS_URL,
                 "current_year": datetime.now().year,
-                "terms_url": f"{frontend_url}/terms",
-                "privacy_url": f"{frontend_url}/privacy",
+                "terms_url": TERMS_URL,
+                "privacy_url": PRIVACY_URL,
             }
 
             cls._send_email(
@@ -139,10 +207,6 @@ class PaymentEmailUtil:
     def send_payment_received_email(cls, payment):
         """Send payment received notification to merchant"""
         try:
-            # Get the frontend URL from settings or use default
-            frontend_url = getattr(settings, "FRONTEND_URL", "http://localhost:5173")
-            transaction_url = f"{frontend_url}/transactions"
-
             # Determine payment description
             if payment.payment_link:
                 payment_description = payment.payment_link.title
@@ -156,7 +220,7 @@ class PaymentEmailUtil:
                 "payer_name": payment.payer_name,
                 "payer_email": payment.payer_email,
                 "reference": payment.reference,
-                "payment_date": payment.created_at.strftime("%B %d, %Y at %I:%M %p"),
+                "payment_date": _format_datetime(payment.created_at),
                 "payment_description": payment_description,
                 "gross_amount": f"{payment.amount:,.2f}",
                 "fee_amount": f"{payment.fee_amount:,.2f}",
@@ -166,10 +230,10 @@ class PaymentEmailUtil:
                 "invoice_number": (
                     payment.invoice.invoice_number if payment.invoice else None
                 ),
-                "transaction_url": transaction_url,
+                "transaction_url": TRANSACTIONS_URL,
                 "current_year": datetime.now().year,
-                "terms_url": f"{frontend_url}/terms",
-                "privacy_url": f"{frontend_url}/privacy",
+                "terms_url": TERMS_URL,
+                "privacy_url": PRIVACY_URL,
             }
 
             cls._send_email(
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.6 on 2026-10-16 17:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payments", "0003_alter_invoice_deleted_at_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="payment",
+            index=models.Index(
+                fields=["merchant_user", "status", "-created_at"],
+                name="payment_merchant_status_idx",
+            ),
+        ),
+    ]
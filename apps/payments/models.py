@@ -1,6 +1,7 @@
 from autoslug import AutoSlugField
 from django.db import models
 from django.utils import timezone
+from django.utils.functional import cached_property
 from apps.common.models import BaseModel
 import uuid
 import secrets
@@ -106,6 +107,11 @@ class PaymentLink(BaseModel):
             and (not self.is_single_use or self.payments_count == 0)
         )
 
+    @cached_property
+    def short_id(self):
+        """First 8 hex characters of link_id, used in payment references"""
+        return self.link_id.bytes[:4].hex()
+
 
 class Invoice(BaseModel):
     """
@@ -176,6 +182,11 @@ class Invoice(BaseModel):
             return False
         return timezone.now().date() > self.due_date
 
+    @cached_property
+    def short_id(self):
+        """First 8 hex characters of invoice_id, used in payment references"""
+        return self.invoice_id.bytes[:4].hex()
+
 
 class InvoiceItem(BaseModel):
     """
@@ -268,6 +279,11 @@ class Payment(BaseModel):
             models.Index(fields=["merchant_user", "-created_at"]),
             models.Index(fields=["reference"]),
             models.Index(fields=["status", "-created_at"]),
+            # Merchant payment history filtered by status
+            models.Index(
+                fields=["merchant_user", "status", "-created_at"],
+                name="payment_merchant_status_idx",
+            ),
         ]
 
     def __str__(self):
@@ -1,7 +1,9 @@
-import time
+import functools, time
+from asgiref.sync import sync_to_async
 from uuid import UUID
 from typing import List, Optional
 from decimal import Decimal
+from django.db import transaction
 from django.utils import timezone
 
 from apps.accounts.models import User
@@ -18,6 +20,7 @@ from apps.common.exceptions import (
     BodyValidationError,
 )
 from apps.payments.schemas import CreateInvoiceSchema, UpdateInvoiceSchema
+from apps.payments.tasks import PaymentEmailTasks
 
 
 class InvoiceManager:
@@ -65,6 +68,13 @@ class InvoiceManager:
             for item in items
         ]
         await InvoiceItem.objects.abulk_create(items_to_create)
+
+        # Email the customer once the invoice is committed; the broker publish
+        # happens off the event loop and a failure to queue is only logged
+        send_invoice_email = functools.partial(
+            PaymentEmailTasks.send_invoice_email.delay, str(invoice.invoice_id)
+        )
+        await sync_to_async(transaction.on_commit)(send_invoice_email, robust=True)
         return invoice
 
     @staticmethod
@@ -109,7 +119,11 @@ class InvoiceManager:
         if status:
             queryset = queryset.filter(status=status)
         invoice_data = await Paginator.paginate_queryset(
-            queryset, page_params.page, page_params.limit
+            queryset,
+            page_params.page,
+            page_params.limit,
+            keyset=True,
+            cursor=page_params.cursor,
         )
         return invoice_data
 
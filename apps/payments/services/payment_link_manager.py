@@ -85,7 +85,11 @@ class PaymentLinkManager:
         if status:
             queryset = queryset.filter(status=status)
         paginated_data = await Paginator.paginate_queryset(
-            queryset, page_params.page, page_params.limit
+            queryset,
+            page_params.page,
+            page_params.limit,
+            keyset=True,
+            cursor=page_params.cursor,
         )
         return paginated_data
 
@@ -1,5 +1,7 @@
 import time
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal
+from django.db import connection
+from django.db.models.sql import InsertQuery
 from apps.common.decorators import aatomic
 from apps.payments.models import (
     Payment,
@@ -31,13 +33,113 @@ logger = logging.getLogger(__name__)
 class PaymentProcessor:
     """Service for processing payments"""
 
-    PAYMENT_FEE_PERCENTAGE = Decimal("0.015")  # 1.5% fee
-    PAYMENT_FEE_CAP = Decimal("1000.00")  # Cap at 1000
+    PAYMENT_FEE_BASIS_POINTS = 150  # 1.5% fee
+    PAYMENT_FEE_CAP_CENTS = 100_000  # Cap at 1000
 
     @staticmethod
     def calculate_fee(amount: Decimal) -> Decimal:
-        fee = amount * PaymentProcessor.PAYMENT_FEE_PERCENTAGE
-        return min(fee, PaymentProcessor.PAYMENT_FEE_CAP)
+        """1.5% of the amount in whole cents (rounded half-up), capped"""
+        amount_cents = int(amount.scaleb(2).to_integral_value(rounding=ROUND_HALF_UP))
+        fee_cents = min(
+            (amount_cents * PaymentProcessor.PAYMENT_FEE_BASIS_POINTS + 5_000)
+            // 10_000,
+            PaymentProcessor.PAYMENT_FEE_CAP_CENTS,
+        )
+        return Decimal(fee_cents).scaleb(-2)
+
+    @staticmethod
+    async def apply_balance_changes(
+        payer_wallet, payer_delta, merchant_wallet, merchant_delta
+    ) -> tuple[dict, dict]:
+        """
+        Debit and credit both wallets in a single relative UPDATE
+        The payer row is only touched if it stays non-negative; returns the new
+        balances by wallet pk, read back via RETURNING, and the net delta applied
+        to each pk (the two deltas are merged when payer and merchant share a wallet)
+        """
+        changes = {payer_wallet.pk: payer_delta}
+        changes[merchant_wallet.pk] = (
+            changes.get(merchant_wallet.pk, 0) + merchant_delta
+        )
+        table = connection.ops.quote_name(Wallet._meta.db_table)
+        cases = " ".join("WHEN %s THEN balance + %s" for _ in changes)
+        placeholders = ", ".join("%s" for _ in changes)
+        params = [value for pk, delta in changes.items() for value in (pk, delta)]
+
+        def update():
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"UPDATE {table} SET balance = CASE id {cases} END, "
+                    f"updated_at = NOW() WHERE id IN ({placeholders}) "
+                    "AND (id <> %s OR balance + %s >= 0) "
+                    "RETURNING id, balance",
+                    [*params, *changes, payer_wallet.pk, changes[payer_wallet.pk]],
+                )
+                return dict(cursor.fetchall())
+
+        return await sync_to_async(update)(), changes
+
+    @staticmethod
+    async def move_funds(payer_wallet, total_amount, merchant_wallet, net_amount):
+        """
+        Move a payment between wallets and sync the in-memory balances
+        Returns (payer before, payer after, merchant before, merchant after)
+        """
+        balances, changes = await PaymentProcessor.apply_balance_changes(
+            payer_wallet, -total_amount, merchant_wallet, net_amount
+        )
+        if payer_wallet.pk not in balances:
+            # A concurrent debit got there first; @aatomic rolls back the credit
+            available = (
+                await Wallet.objects.filter(pk=payer_wallet.pk)
+                .values_list("balance", flat=True)
+                .afirst()
+            )
+            raise BodyValidationError(
+                "wallet_id",
+                f"Insufficient balance. Required: {total_amount}, Available: {available}",
+            )
+        balance_after = balances[payer_wallet.pk]
+        merchant_balance_after = balances[merchant_wallet.pk]
+        payer_wallet.balance = balance_after
+        merchant_wallet.balance = merchant_balance_after
+        return (
+            balance_after - changes[payer_wallet.pk],
+            balance_after,
+            merchant_balance_after - changes[merchant_wallet.pk],
+            merchant_balance_after,
+        )
+
+    @staticmethod
+    async def create_payment_records(transaction: Transaction, payment: Payment):
+        """
+        Insert a payment and the transaction it points at in one statement
+        Both pks are generated client-side, so the payment row can reference the
+        transaction from a writable CTE without waiting on RETURNING
+        """
+
+        def insert():
+            statements = []
+            for obj in (transaction, payment):
+                query = InsertQuery(type(obj))
+                query.insert_values(
+                    [f for f in obj._meta.local_concrete_fields if not f.generated],
+                    [obj],
+                )
+                statements.extend(query.get_compiler(connection=connection).as_sql())
+            (transaction_sql, transaction_params), (payment_sql, payment_params) = (
+                statements
+            )
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"WITH txn AS ({transaction_sql}) {payment_sql}",
+                    [*transaction_params, *payment_params],
+                )
+
+        await sync_to_async(insert)()
+        for obj in (transaction, payment):
+            obj._state.adding = False
+            obj._state.db = connection.alias
 
     @staticmethod
     @aatomic
@@ -88,23 +190,21 @@ class PaymentProcessor:
             )
 
         # Generate reference
-        reference = f"PAY-{int(time.time())}-{link.link_id.hex[:8]}"
-
-        # Debit payer wallet
-        balance_before = payer_wallet.balance
-        payer_wallet.balance -= total_amount
-        await payer_wallet.asave(update_fields=["balance", "updated_at"])
-        balance_after = payer_wallet.balance
+        reference = f"PAY-{int(time.time())}-{link.short_id}"
 
-        # Credit merchant wallet
+        # Debit payer and credit merchant in one statement
         merchant_wallet = link.wallet
-        merchant_balance_before = merchant_wallet.balance
-        merchant_wallet.balance += net_amount
-        await merchant_wallet.asave(update_fields=["balance", "updated_at"])
-        merchant_balance_after = merchant_wallet.balance
+        (
+            balance_before,
+            balance_after,
+            merchant_balance_before,
+            merchant_balance_after,
+        ) = await PaymentProcessor.move_funds(
+            payer_wallet, total_amount, merchant_wallet, net_amount
+        )
 
-        # Create transaction record
-        transaction = await Transaction.objects.acreate(
+        # Build the transaction and payment rows, then insert both together
+        transaction = Transaction(
             from_user=payer_wallet.user,
             from_wallet=payer_wallet,
             to_wallet=merchant_wallet,
@@ -123,8 +223,9 @@ class PaymentProcessor:
             external_reference=reference,
         )
 
-        # Create payment record
-        payment = await Payment.objects.acreate(
+        # The related objects passed here stay cached on the instance, so
+        # callers can serialize it without re-fetching.
+        payment = Payment(
             payment_link=link,
             payer_name=data.payer_name
             or f"{payer_wallet.user.first_name} {payer_wallet.user.last_name}",
@@ -140,6 +241,7 @@ class PaymentProcessor:
             reference=reference,
             transaction=transaction,
         )
+        await PaymentProcessor.create_payment_records(transaction, payment)
 
         # Update payment link stats
         link.payments_count += 1
@@ -236,22 +338,21 @@ class PaymentProcessor:
                 f"Insufficient balance. Required: {total_amount}, Available: {payer_wallet.balance}",
             )
 
-        reference = f"INV-PAY-{int(time.time())}-{invoice.invoice_id.hex[:8]}"
+        reference = f"INV-PAY-{int(time.time())}-{invoice.short_id}"
 
         # Process payment (debit/credit wallets)
-        balance_before = payer_wallet.balance
-        payer_wallet.balance -= total_amount
-        await payer_wallet.asave(update_fields=["balance", "updated_at"])
-        balance_after = payer_wallet.balance
-
         merchant_wallet = invoice.wallet
-        merchant_balance_before = merchant_wallet.balance
-        merchant_wallet.balance += net_amount
-        await merchant_wallet.asave(update_fields=["balance", "updated_at"])
-        merchant_balance_after = merchant_wallet.balance
+        (
+            balance_before,
+            balance_after,
+            merchant_balance_before,
+            merchant_balance_after,
+        ) = await PaymentProcessor.move_funds(
+            payer_wallet, total_amount, merchant_wallet, net_amount
+        )
 
-        # Create transaction
-        transaction = await Transaction.objects.acreate(
+        # Build the transaction and payment rows, then insert both together
+        transaction = Transaction(
             from_user=payer_wallet.user,
             from_wallet=payer_wallet,
             to_user=invoice.user,
@@ -270,8 +371,9 @@ class PaymentProcessor:
             external_reference=reference,
         )
 
-        # Create payment record
-        payment = await Payment.objects.acreate(
+        # The related objects passed here stay cached on the instance, so
+        # callers can serialize it without re-fetching.
+        payment = Payment(
             invoice=invoice,
             payer_name=data.payer_name or invoice.customer_name,
             payer_email=data.payer_email or invoice.customer_email,
@@ -286,6 +388,7 @@ class PaymentProcessor:
             reference=reference,
             transaction=transaction,
         )
+        await PaymentProcessor.create_payment_records(transaction, payment)
 
         await InvoiceManager.mark_invoice_paid(invoice, amount)
 
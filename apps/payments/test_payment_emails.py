@@ -0,0 +1,85 @@
+"""
+Unit tests for payment email delivery (apps/payments/emails.py)
+
+Tests which SMTP failures are retried on the shared connection.
+"""
+
+import pytest
+import smtplib
+import socket
+from unittest.mock import Mock, patch
+
+from apps.payments.emails import PaymentEmailUtil
+
+
+@pytest.fixture
+def connections():
+    """Patch get_connection to hand out mock connections in order."""
+    created = []
+
+    def get_connection():
+        connection = Mock()
+        created.append(connection)
+        return connection
+
+    PaymentEmailUtil._connection = None
+    with patch("apps.payments.emails.get_connection", side_effect=get_connection):
+        yield created
+    PaymentEmailUtil._connection = None
+
+
+@pytest.mark.unit
+@pytest.mark.payment
+class TestDeliver:
+    """Test PaymentEmailUtil._deliver retry behaviour."""
+
+    def test_dropped_session_is_retried_once(self, connections):
+        message = Mock()
+        first = Mock()
+        first.send_messages.side_effect = smtplib.SMTPServerDisconnected()
+        PaymentEmailUtil._connection = first
+
+        PaymentEmailUtil._deliver(message)
+
+        first.close.assert_called_once()
+        assert len(connections) == 1
+        connections[0].send_messages.assert_called_once_with([message])
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            socket.timeout("timed out after DATA"),
+            smtplib.SMTPRecipientsRefused({}),
+            smtplib.SMTPDataError(554, b"rejected"),
+        ],
+    )
+    def test_other_failures_are_not_resent(self, connections, error):
+        """The server may already hold the message, so a resend could duplicate it."""
+        message = Mock()
+        connection = Mock()
+        connection.send_messages.side_effect = error
+        PaymentEmailUtil._connection = connection
+
+        with pytest.raises(type(error)):
+            PaymentEmailUtil._deliver(message)
+
+        connection.send_messages.assert_called_once_with([message])
+        assert connections == []
+        assert PaymentEmailUtil._connection is None
+
+    def test_failed_open_is_retried(self, connections):
+        message = Mock()
+
+        def get_connection():
+            connection = Mock()
+            if not connections:
+                connection.open.side_effect = ConnectionRefusedError()
+            connections.append(connection)
+            return connection
+
+        with patch("apps.payments.emails.get_connection", side_effect=get_connection):
+            PaymentEmailUtil._deliver(message)
+
+        assert len(connections) == 2
+        connections[0].send_messages.assert_not_called()
+        connections[1].send_messages.assert_called_once_with([message])
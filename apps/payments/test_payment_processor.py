@@ -0,0 +1,142 @@
+"""
+Unit tests for Payment Processing (apps/payments/services/payment_processor.py)
+
+Tests fee calculation and the wallet balance movement behind payments.
+These are UNIT tests - testing business logic directly, not API endpoints.
+"""
+
+import pytest
+from decimal import Decimal
+from unittest.mock import patch
+
+from apps.accounts.models import User
+from apps.common.exceptions import BodyValidationError
+from apps.payments.models import Payment, PaymentLink
+from apps.payments.schemas import MakePaymentSchema
+from apps.payments.services.payment_processor import PaymentProcessor
+from apps.transactions.models import Transaction
+from apps.wallets.models import Wallet
+from apps.wallets.services.wallet_manager import WalletManager
+
+
+@pytest.fixture
+async def merchant_wallet(ngn_currency):
+    merchant = await User.objects.acreate(
+        first_name="Merchant",
+        last_name="User",
+        email="merchant@example.com",
+        is_email_verified=True,
+    )
+    return await Wallet.objects.acreate(
+        user=merchant,
+        currency=ngn_currency,
+        account_number=await WalletManager.generate_account_number(),
+        balance=Decimal("0.00"),
+        available_balance=Decimal("0.00"),
+        name="Merchant Wallet",
+        is_default=True,
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.payment
+class TestFeeCalculation:
+    """Test the 1.5% payment fee."""
+
+    def test_standard_fee(self):
+        assert PaymentProcessor.calculate_fee(Decimal("10.00")) == Decimal("0.15")
+
+    def test_half_cent_rounds_up(self):
+        """1.00 * 1.5% is exactly 1.5 cents, which rounds up to 2."""
+        assert PaymentProcessor.calculate_fee(Decimal("1.00")) == Decimal("0.02")
+
+    def test_below_half_cent_rounds_down(self):
+        """0.99 * 1.5% is 1.485 cents."""
+        assert PaymentProcessor.calculate_fee(Decimal("0.99")) == Decimal("0.01")
+
+    def test_tiny_amount_has_no_fee(self):
+        assert PaymentProcessor.calculate_fee(Decimal("0.30")) == Decimal("0.00")
+
+    def test_fee_is_whole_cents(self):
+        fee = PaymentProcessor.calculate_fee(Decimal("1234.57"))
+        assert fee == Decimal("18.52")
+        assert fee.as_tuple().exponent == -2
+
+    def test_fee_just_below_cap(self):
+        assert PaymentProcessor.calculate_fee(Decimal("66000.00")) == Decimal("990.00")
+
+    def test_fee_capped(self):
+        assert PaymentProcessor.calculate_fee(Decimal("100000.00")) == Decimal(
+            "1000.00"
+        )
+        assert PaymentProcessor.calculate_fee(Decimal("5000000.00")) == Decimal(
+            "1000.00"
+        )
+
+    @pytest.mark.parametrize(
+        "amount", ["0.01", "0.99", "1.00", "10.00", "1234.57", "100000.00"]
+    )
+    def test_net_plus_fee_equals_amount(self, amount):
+        """The merchant receives amount - fee, with nothing lost to rounding."""
+        amount = Decimal(amount)
+        fee = PaymentProcessor.calculate_fee(amount)
+        net = amount - fee
+
+        assert Decimal("0") <= fee <= amount
+        assert net + fee == amount
+        assert net.as_tuple().exponent == -2
+
+
+@pytest.mark.unit
+@pytest.mark.payment
+class TestMoveFunds:
+    """Test debiting the payer and crediting the merchant."""
+
+    @pytest.mark.django_db(transaction=True)
+    async def test_same_wallet_reports_true_before_balances(self, user_wallet):
+        """Paying yourself only moves the fee, and 'before' is the real balance."""
+        merchant_wallet = await Wallet.objects.aget(pk=user_wallet.pk)
+
+        before, after, merchant_before, merchant_after = (
+            await PaymentProcessor.move_funds(
+                user_wallet, Decimal("101.50"), merchant_wallet, Decimal("100.00")
+            )
+        )
+
+        assert before == Decimal("1000.00")
+        assert merchant_before == Decimal("1000.00")
+        assert after == merchant_after == Decimal("998.50")
+        await user_wallet.arefresh_from_db()
+        assert user_wallet.balance == Decimal("998.50")
+
+    @pytest.mark.django_db(transaction=True)
+    async def test_balance_drained_after_precheck_rejects_payment(
+        self, user_wallet, merchant_wallet
+    ):
+        """A debit landing between the balance check and the UPDATE loses the race."""
+        link = await PaymentLink.objects.acreate(
+            user=merchant_wallet.user,
+            wallet=merchant_wallet,
+            title="Stale Balance Link",
+            amount=Decimal("500.00"),
+            is_amount_fixed=True,
+        )
+        move_funds = PaymentProcessor.move_funds
+
+        async def drain_then_move(payer_wallet, *args):
+            # The in-memory balance (1000) already passed the pre-check
+            await Wallet.objects.filter(pk=payer_wallet.pk).aupdate(
+                balance=Decimal("100.00")
+            )
+            return await move_funds(payer_wallet, *args)
+
+        with patch.object(PaymentProcessor, "move_funds", drain_then_move):
+            with pytest.raises(BodyValidationError):
+                await PaymentProcessor.process_payment_link_payment(
+                    link.slug, MakePaymentSchema(wallet_id=user_wallet.wallet_id)
+                )
+
+        await merchant_wallet.arefresh_from_db()
+        assert merchant_wallet.balance == Decimal("0.00")
+        assert not await Payment.objects.filter(payment_link=link).aexists()
+        assert not await Transaction.objects.filter(from_wallet=user_wallet).aexists()
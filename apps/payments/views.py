@@ -25,7 +25,6 @@ from apps.payments.services.payment_link_manager import PaymentLinkManager
 from apps.payments.services.invoice_manager import InvoiceManager
 from apps.payments.services.payment_processor import PaymentProcessor
 from apps.payments.models import Payment, PaymentLinkStatus
-from .tasks import PaymentEmailTasks
 
 logger = logging.getLogger(__name__)
 payment_router = Router(tags=["Payments (18)"])
@@ -119,16 +118,6 @@ async def get_payment_link_public(request, slug: str):
 )
 async def pay_via_link(request, slug: str, data: MakePaymentSchema):
     payment = await PaymentProcessor.process_payment_link_payment(slug, data)
-
-    payment = await Payment.objects.select_related(
-        "payment_link",
-        "payer_wallet",
-        "payer_wallet__currency",
-        "merchant_wallet",
-        "merchant_user",
-        "merchant_wallet__currency",
-        "transaction",
-    ).aget_or_none(payment_id=payment.payment_id)
     return CustomResponse.success("Payment completed successfully", payment, 201)
 
 
@@ -156,16 +145,6 @@ async def get_invoice_public(request, invoice_number: str):
 async def pay_invoice(request, invoice_number: str, data: MakePaymentSchema):
     """Pay an invoice"""
     payment = await PaymentProcessor.process_invoice_payment(invoice_number, data)
-
-    payment = await Payment.objects.select_related(
-        "invoice",
-        "payer_wallet",
-        "payer_wallet__currency",
-        "merchant_wallet",
-        "merchant_user",
-        "merchant_wallet__currency",
-        "transaction",
-    ).aget_or_none(payment_id=payment.payment_id)
     return CustomResponse.success("Payment completed successfully", payment, 201)
 
 
@@ -179,13 +158,6 @@ async def create_invoice(request, data: CreateInvoiceSchema):
 
     user = request.auth
     invoice = await InvoiceManager.create_invoice(user, data)
-
-    # Send invoice email to customer asynchronously via Celery
-    try:
-        PaymentEmailTasks.send_invoice_email.delay(str(invoice.invoice_id))
-    except Exception as e:
-        logger.error(f"Failed to queue invoice email: {e}")
-
     invoice = await InvoiceManager.get_invoice(user, invoice.invoice_id)
     return CustomResponse.success("Invoice created successfully", invoice, 201)
 
@@ -262,20 +234,37 @@ async def get_invoice_public(request, invoice_number: str):
 )
 async def pay_invoice(request, invoice_number: str, data: MakePaymentSchema):
     payment = await PaymentProcessor.process_invoice_payment(invoice_number, data)
-
-    payment = await Payment.objects.select_related(
-        "invoice",
-        "payer_wallet",
-        "payer_wallet__currency",
-        "merchant_wallet",
-        "merchant_wallet__currency",
-        "transaction",
-        "merchant_user",
-    ).aget_or_none(payment_id=payment.payment_id)
     return CustomResponse.success("Payment completed successfully", payment, 201)
 
 
 # ==================== PAYMENT HISTORY ====================
+# Only the columns PaymentSchema renders; related foreign keys are plain ids
+PAYMENT_RESPONSE_FIELDS = (
+    "payment_id",
+    "payment_link",
+    "payer_name",
+    "payer_email",
+    "payer_phone",
+    "payer_wallet",
+    "amount",
+    "fee_amount",
+    "net_amount",
+    "status",
+    "reference",
+    "external_reference",
+    "metadata",
+    "created_at",
+    "payer_wallet__currency__code",
+    "payer_wallet__currency__name",
+    "payer_wallet__currency__symbol",
+    "payer_wallet__currency__decimal_places",
+    "payer_wallet__currency__is_crypto",
+    "merchant_user__first_name",
+    "merchant_user__last_name",
+    "invoice__invoice_number",
+)
+
+
 @payment_router.get(
     "/payments/list",
     summary="List merchant payments",
@@ -288,19 +277,20 @@ async def list_merchant_payments(
     page_params: PaginationQuerySchema = Query(...),
 ):
     user = request.auth
-    queryset = Payment.objects.filter(merchant_user=user).select_related(
-        "payer_wallet",
-        "payer_wallet__currency",
-        "merchant_wallet",
-        "payment_link",
-        "invoice",
-        "merchant_user",
+    queryset = (
+        Payment.objects.filter(merchant_user=user)
+        .select_related("payer_wallet__currency", "invoice", "merchant_user")
+        .only(*PAYMENT_RESPONSE_FIELDS)
     )
     if status:
         queryset = queryset.filter(status=status)
 
     paginated_payments_data = await Paginator.paginate_queryset(
-        queryset, page_params.page, page_params.limit
+        queryset,
+        page_params.page,
+        page_params.limit,
+        keyset=True,
+        cursor=page_params.cursor,
     )
     return CustomResponse.success(
         "Payments retrieved successfully", paginated_payments_data
@@ -316,14 +306,13 @@ async def list_merchant_payments(
 async def get_payment(request, payment_id: UUID):
     user = request.auth
 
-    payment = await Payment.objects.select_related(
-        "payer_wallet",
-        "payer_wallet__currency",
-        "merchant_wallet",
-        "payment_link",
-        "invoice",
-        "merchant_user",
-    ).aget_or_none(payment_id=payment_id, merchant_user=user)
+    payment = (
+        await Payment.objects.select_related(
+            "payer_wallet__currency", "invoice", "merchant_user"
+        )
+        .only(*PAYMENT_RESPONSE_FIELDS)
+        .aget_or_none(payment_id=payment_id, merchant_user=user)
+    )
 
     if not payment:
         raise NotFoundError("Payment not found")
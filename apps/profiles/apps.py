@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class ProfilesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.profiles"
+
+    def ready(self):
+        """Import signals when app is ready"""
+        import apps.profiles.signals
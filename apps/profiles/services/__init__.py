@@ -0,0 +1,3 @@
+from .country_cache import CountryCache
+
+__all__ = ["CountryCache"]
@@ -0,0 +1,48 @@
+from typing import Dict, Iterable, Optional
+from uuid import UUID
+from cachetools import TTLCache
+import threading
+
+from apps.profiles.models import Country
+
+# Countries are reference data that rarely change, so they are kept in a
+# per-process cache. Entries are dropped on save/delete (see signals.py) and
+# the TTL bounds staleness for changes made by other processes.
+_COUNTRY_CACHE = TTLCache(maxsize=512, ttl=3600)
+_COUNTRY_CACHE_LOCK = threading.Lock()
+
+
+class CountryCache:
+    """In-process cache for Country lookups by id."""
+
+    @staticmethod
+    async def get_many(country_ids: Iterable[UUID]) -> Dict[UUID, Country]:
+        """Return the countries found for the given ids, querying only misses."""
+        countries = {}
+        missing = []
+        with _COUNTRY_CACHE_LOCK:
+            for country_id in set(country_ids):
+                country = _COUNTRY_CACHE.get(country_id)
+                if country is None:
+                    missing.append(country_id)
+                else:
+                    countries[country_id] = country
+
+        if missing:
+            fetched = {c.id: c async for c in Country.objects.filter(id__in=missing)}
+            with _COUNTRY_CACHE_LOCK:
+                _COUNTRY_CACHE.update(fetched)
+            countries.update(fetched)
+        return countries
+
+    @staticmethod
+    async def get(country_id: UUID) -> Optional[Country]:
+        return (await CountryCache.get_many([country_id])).get(country_id)
+
+    @staticmethod
+    def invalidate(country_id: Optional[UUID] = None) -> None:
+        with _COUNTRY_CACHE_LOCK:
+            if country_id is None:
+                _COUNTRY_CACHE.clear()
+            else:
+                _COUNTRY_CACHE.pop(country_id, None)
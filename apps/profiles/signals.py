@@ -0,0 +1,12 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from apps.profiles.models import Country
+from apps.profiles.services import CountryCache
+
+
+@receiver(post_save, sender=Country)
+@receiver(post_delete, sender=Country)
+def invalidate_country_cache(sender, instance, **kwargs):
+    """Drop the cached copy of a country whenever it changes"""
+    CountryCache.invalidate(instance.id)
@@ -28,10 +28,15 @@ profiles_router = Router(tags=["Profiles (3)"])
 @cacheable(key="profile:{{user_id}}", ttl=60)
 async def get_user(request):
     user = request.auth
-    kyc = (
-        await KYCVerification.objects.filter(user=user).order_by("-created_at").afirst()
+    latest_kyc = (
+        await KYCVerification.objects.filter(user=user)
+        .order_by("-created_at")
+        .values_list("level", "status")
+        .afirst()
+    )
+    user.kyc_level = (
+        latest_kyc[0] if latest_kyc and latest_kyc[1] == KYCStatus.APPROVED else None
     )
-    user.kyc_level = kyc.level if kyc and kyc.status == KYCStatus.APPROVED else None
     return CustomResponse.success(message="Profile retrieved successfully", data=user)
 
 
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.6 on 2026-10-16 18:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wallets", "0006_alter_currency_deleted_at_alter_qrcode_deleted_at_and_more"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="wallet",
+            constraint=models.CheckConstraint(
+                condition=models.Q(("balance__gte", 0)), name="wallet_balance_nonneg"
+            ),
+        ),
+    ]
@@ -167,7 +167,11 @@ class Wallet(BaseModel):
             models.UniqueConstraint(
                 fields=["user", "currency", "wallet_type", "is_default"],
                 name="unique_default_wallet_per_currency",
-            )
+            ),
+            # Last line of defence for every debit path, not only guarded ones
+            models.CheckConstraint(
+                condition=models.Q(balance__gte=0), name="wallet_balance_nonneg"
+            ),
         ]
         indexes = [
             models.Index(fields=["user", "currency"]),
@@ -43,6 +43,9 @@ app.conf.update(
         "loans.auto_approve_loan": {"queue": "loans"},
         "loans.auto_disburse_loan": {"queue": "loans"},
         "loans.process_auto_repayments": {"queue": "loans"},
+        "loans.process_user_auto_repayments": {"queue": "loans"},
+        "loans.retry_due_auto_repayments": {"queue": "loans"},
+        "loans.retry_failed_auto_repayment": {"queue": "loans"},
     },
     # Queue definitions with priorities
     task_default_queue="default",
@@ -72,6 +75,12 @@ app.conf.update(
             routing_key="loans",
             queue_arguments={"x-max-priority": 10},
         ),
+        Queue(
+            "loans_large",
+            Exchange("loans_large"),
+            routing_key="loans_large",
+            queue_arguments={"x-max-priority": 10},
+        ),
         # Medium priority queues
         Queue(
             "notifications",
@@ -85,6 +94,17 @@ app.conf.update(
             routing_key="audit",
             queue_arguments={"x-max-priority": 5},
         ),
+        # Low priority, transient: periodic sweeps and cleanups are rerun by
+        # beat, so skip the broker's disk writes and let stale runs expire.
+        # A new name, because brokers that already hold the durable
+        # "maintenance" queue reject a redeclare with different arguments.
+        Queue(
+            "maintenance_transient",
+            Exchange("maintenance_transient", delivery_mode=1),
+            routing_key="maintenance_transient",
+            durable=False,
+            queue_arguments={"x-max-priority": 1, "x-message-ttl": 86400000},
+        ),
         # Default queue
         Queue(
             "default",
@@ -184,6 +204,10 @@ app.conf.beat_schedule = {
         "task": "loans.process_auto_repayments",
         "schedule": crontab(hour=3, minute=0),  # 3 AM daily
     },
+    "retry-due-auto-repayments": {
+        "task": "loans.retry_due_auto_repayments",
+        "schedule": crontab(minute=30),  # Every hour
+    },
     "update-overdue-schedules": {
         "task": "loans.update_overdue_schedules",
         "schedule": crontab(hour=1, minute=0),  # 1 AM daily